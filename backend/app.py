@@ -1,3 +1,4 @@
+import logging
 import os
 
 from flask import Flask, jsonify
@@ -90,5 +91,12 @@ def create_app():
 
 
 if __name__ == "__main__":
+    # The log format never shows thread or process details, so skip
+    # collecting them for every LogRecord. This is process-wide, so it is
+    # set here in the entry point rather than when utils.logger is imported.
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
     app = create_app()
     app.run(debug=True, port=5000)
@@ -13,6 +13,7 @@ Responsibilities
 import json
 import os
 import pickle
+import sys
 from typing import Any, Dict, List
 
 from utils.logger import app_logger
@@ -61,7 +62,10 @@ class RequirementClassifier:
             with open(model_info_path, "r") as f:
                 self.model_info = json.load(f)
 
-        self.classes: List[str] = list(self.model.classes_)
+        # Plain interned str labels: the model's classes_ are numpy.str_, and
+        # downstream code keys dicts by category (see quality_scorer).
+        # Index-aligned with predict_proba() columns.
+        self.classes: List[str] = [sys.intern(str(cls)) for cls in self.model.classes_]
         app_logger.info(
             f"Model loaded successfully | "
             f"accuracy={self.model_info.get('accuracy', 'N/A'):.4f} | "
@@ -96,14 +100,17 @@ class RequirementClassifier:
             }
 
         X = self.vectorizer.transform([text.strip()])
-        prediction = self.model.predict(X)[0]
+        # predict() is the argmax of the same scores predict_proba() normalises,
+        # so one model call gives both the label and the probabilities.
         proba = self.model.predict_proba(X)[0]
-        confidence = round(float(max(proba)) * 100, 2)
-        probabilities = {cls: round(float(p) * 100, 2) for cls, p in zip(self.classes, proba)}
+        best = int(proba.argmax())
+        proba = proba.tolist()
+        confidence = round(proba[best] * 100, 2)
+        probabilities = {cls: round(p * 100, 2) for cls, p in zip(self.classes, proba)}
 
         return {
             "text": text,
-            "category": prediction,
+            "category": self.classes[best],
             "confidence": confidence,
             "probabilities": probabilities,
         }
@@ -140,18 +147,21 @@ class RequirementClassifier:
         # Batch vectorize + predict in ONE call each (major speedup)
         if valid_texts:
             X = self.vectorizer.transform(valid_texts)
-            predictions = self.model.predict(X)
             probas = self.model.predict_proba(X)
+            # Row argmax == predict(); tolist() hands back plain floats in one go
+            best = probas.argmax(axis=1).tolist()
+            probas = probas.tolist()
 
             for i, orig_idx in enumerate(valid_indices):
-                confidence = round(float(max(probas[i])) * 100, 2)
+                row = probas[i]
+                confidence = round(row[best[i]] * 100, 2)
                 probabilities = {
-                    cls: round(float(p) * 100, 2)
-                    for cls, p in zip(self.classes, probas[i])
+                    cls: round(p * 100, 2)
+                    for cls, p in zip(self.classes, row)
                 }
                 results[orig_idx] = {
                     "text": texts[orig_idx],
-                    "category": predictions[i],
+                    "category": self.classes[best[i]],
                     "confidence": confidence,
                     "probabilities": probabilities,
                     "index": orig_idx,
@@ -9,9 +9,12 @@ Supported formats
 - DOCX → python-docx (handles paragraphs, tables, headers)
 """
 
+import hashlib
 import os
 import re
-from typing import Dict, Any
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Tuple
 
 import pdfplumber
 from docx import Document
@@ -19,6 +22,14 @@ from docx import Document
 from utils.logger import app_logger
 
 
+# Extraction results keyed by (extension, content digest), so re-analysing an
+# unchanged upload skips the pdfplumber / python-docx parse. Values are
+# (cleaned_text, page_count, word_count) — all immutable, safe to share.
+_EXTRACT_CACHE: "OrderedDict[Tuple[str, bytes], Tuple[str, int, int]]" = OrderedDict()
+_EXTRACT_CACHE_SIZE = 64
+_EXTRACT_CACHE_LOCK = threading.Lock()
+
+
 # --------------------------------------------------------------------------- #
 # Public entry point                                                            #
 # --------------------------------------------------------------------------- #
@@ -45,18 +56,33 @@ def process_document(file_path: str) -> Dict[str, Any]:
 
     ext = file_path.rsplit(".", 1)[-1].lower() if "." in file_path else ""
 
+    if ext not in ("pdf", "docx"):
+        return _error_result(f"Unsupported file type: .{ext}", file_path)
+    file_type = ext
+
     try:
-        if ext == "pdf":
-            text, page_count = extract_text_from_pdf(file_path)
-            file_type = "pdf"
-        elif ext == "docx":
-            text, page_count = extract_text_from_docx(file_path)
-            file_type = "docx"
+        cache_key = (ext, _file_digest(file_path))
+        with _EXTRACT_CACHE_LOCK:
+            cached = _EXTRACT_CACHE.get(cache_key)
+            if cached is not None:
+                _EXTRACT_CACHE.move_to_end(cache_key)
+
+        if cached is not None:
+            cleaned, page_count, word_count = cached
+            app_logger.debug("Document extraction served from cache")
         else:
-            return _error_result(f"Unsupported file type: .{ext}", file_path)
+            if ext == "pdf":
+                text, page_count = extract_text_from_pdf(file_path)
+            else:
+                text, page_count = extract_text_from_docx(file_path)
 
-        cleaned = clean_extracted_text(text)
-        word_count = len(cleaned.split())
+            cleaned = clean_extracted_text(text)
+            word_count = len(cleaned.split())
+
+            with _EXTRACT_CACHE_LOCK:
+                _EXTRACT_CACHE[cache_key] = (cleaned, page_count, word_count)
+                while len(_EXTRACT_CACHE) > _EXTRACT_CACHE_SIZE:
+                    _EXTRACT_CACHE.popitem(last=False)
 
         app_logger.info(
             f"Document processed | type={file_type} | pages={page_count} | words={word_count}"
@@ -103,7 +129,7 @@ def extract_text_from_pdf(file_path: str) -> tuple:
             if page_text:
                 text_parts.append(page_text)
             else:
-                app_logger.debug(f"Page {page_num} had no extractable text (may be image-based)")
+                app_logger.debug("Page %d had no extractable text (may be image-based)", page_num)
 
     if not text_parts:
         raise ValueError("No readable text found in the PDF. The file may be scanned/image-based.")
@@ -122,7 +148,8 @@ def extract_text_from_docx(file_path: str) -> tuple:
     Captures:
     - Normal paragraphs
     - Table cell text
-    - Text from headers/footers (where accessible)
+
+    Headers and footers are not read.
 
     Args:
         file_path: Path to the DOCX file.
@@ -206,6 +233,15 @@ def clean_extracted_text(text: str) -> str:
 # Internal helpers                                                              #
 # --------------------------------------------------------------------------- #
 
+def _file_digest(file_path: str) -> bytes:
+    """Digest of the file's bytes (streamed, so large PDFs aren't held in memory)."""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.digest()
+
+
 def _error_result(message: str, file_path: str) -> Dict[str, Any]:
     app_logger.error(f"Document processing error [{file_path}]: {message}")
     return {
@@ -18,8 +18,13 @@ How it works
 Uses Gemini AI for enhanced insights when available, with keyword-based fallback.
 """
 
+import hashlib
 import re
-from typing import Any, Dict, List, Optional
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+import ahocorasick
 
 from utils.logger import app_logger
 from services.gemini_service import analyze_quality_plan_with_gemini
@@ -83,6 +88,27 @@ CATEGORY_EVIDENCE_KEYWORDS: Dict[str, List[str]] = {
     ],
 }
 
+def _build_automaton(kw_lowers: List[str]) -> "ahocorasick.Automaton":
+    """Aho–Corasick automaton over lowercase keywords; each match yields the keyword."""
+    automaton = ahocorasick.Automaton()
+    for kw in kw_lowers:
+        automaton.add_word(kw, kw)
+    automaton.make_automaton()
+    return automaton
+
+
+# Lowercased keyword lists, in dictionary order (evidence is reported keyword-first)
+_CATEGORY_KW_LOWERS: Dict[str, List[str]] = {
+    cat: [kw.lower() for kw in keywords]
+    for cat, keywords in CATEGORY_EVIDENCE_KEYWORDS.items()
+}
+
+# One automaton over every category's keywords, so a plan is scanned once
+# for all seven categories instead of once per keyword per category.
+_EVIDENCE_AUTOMATON = _build_automaton(
+    list(dict.fromkeys(kw for kws in _CATEGORY_KW_LOWERS.values() for kw in kws))
+)
+
 # How much each category contributes to achievable quality (same weights as scorer)
 CATEGORY_WEIGHTS: Dict[str, float] = {
     "Functionality":   0.30,
@@ -96,6 +122,12 @@ CATEGORY_WEIGHTS: Dict[str, float] = {
 
 ALL_CATEGORIES = list(CATEGORY_WEIGHTS.keys())
 
+# Per-category evidence keyed by a digest of the plan text, so the cache
+# holds the snippets rather than whole plan documents.
+_EVIDENCE_CACHE: "OrderedDict[bytes, Dict[str, Tuple[str, ...]]]" = OrderedDict()
+_EVIDENCE_CACHE_SIZE = 32
+_EVIDENCE_CACHE_LOCK = threading.Lock()
+
 
 # --------------------------------------------------------------------------- #
 # Public API                                                                    #
@@ -132,8 +164,6 @@ def analyze_quality_plan(
     if not plan_text or not plan_text.strip():
         return _empty_result("Quality plan document is empty or unreadable.")
 
-    plan_text_lower = plan_text.lower()
-
     # ── 0. Detect QP domain and check for mismatch ───────────────────── #
     from services.quality_scorer import detect_domain  # import here to avoid circular import
 
@@ -158,9 +188,10 @@ def analyze_quality_plan(
     covered_count = 0
     covered_weight = 0.0
 
+    evidence_by_category = _category_evidence(plan_text)
+
     for cat in ALL_CATEGORIES:
-        keywords = CATEGORY_EVIDENCE_KEYWORDS.get(cat, [])
-        evidence = _find_evidence(plan_text_lower, plan_text, keywords)
+        evidence = list(evidence_by_category.get(cat, ()))
         srs_count = srs_category_scores.get(cat, {}).get("count", 0)
         is_in_srs = cat in srs_categories_present
         is_covered = len(evidence) > 0
@@ -283,19 +314,125 @@ def analyze_quality_plan(
 # Evidence finding                                                              #
 # --------------------------------------------------------------------------- #
 
-def _find_evidence(text_lower: str, original_text: str, keywords: List[str]) -> List[str]:
+def _category_evidence(plan_text: str) -> Dict[str, Tuple[str, ...]]:
+    """
+    Evidence snippets for every category, memoised on a digest of the plan.
+
+    Keywords are module-level constants, so the result depends on the text
+    alone; re-analysing the same plan (e.g. against another SRS analysis)
+    skips the scan. Snippets are tuples so cached results stay immutable.
+    """
+    cache_key = hashlib.blake2b(
+        plan_text.encode("utf-8", "surrogatepass"), digest_size=16
+    ).digest()
+    with _EVIDENCE_CACHE_LOCK:
+        cached = _EVIDENCE_CACHE.get(cache_key)
+        if cached is not None:
+            _EVIDENCE_CACHE.move_to_end(cache_key)
+            return cached
+
+    # One pass over the plan finds every keyword of every category
+    sentences, keyword_hits = _scan_all(plan_text)
+    evidence = {
+        cat: tuple(_collect_evidence(sentences, keyword_hits, kw_lowers))
+        for cat, kw_lowers in _CATEGORY_KW_LOWERS.items()
+    }
+
+    with _EVIDENCE_CACHE_LOCK:
+        _EVIDENCE_CACHE[cache_key] = evidence
+        while len(_EVIDENCE_CACHE) > _EVIDENCE_CACHE_SIZE:
+            _EVIDENCE_CACHE.popitem(last=False)
+    return evidence
+
+
+def _find_evidence(original_text: str, keywords: List[str]) -> List[str]:
     """
     Search the plan text for keyword matches and return clean sentence-based
-    evidence snippets.
+    evidence snippets. Matching is case-insensitive.
+
+    Thin wrapper over _scan_all() + _collect_evidence() for a single keyword
+    list; analyze_quality_plan() scans once and collects per category.
+    """
+    kw_lowers = [keyword.lower() for keyword in keywords]
+    if all(kw in _EVIDENCE_AUTOMATON for kw in kw_lowers):
+        automaton = _EVIDENCE_AUTOMATON
+    else:
+        automaton = _build_automaton(kw_lowers)
+    sentences, keyword_hits = _scan_all(original_text, automaton)
+    return _collect_evidence(sentences, keyword_hits, kw_lowers)
+
+
+def _scan_all(
+    original_text: str,
+    automaton: "ahocorasick.Automaton" = _EVIDENCE_AUTOMATON,
+) -> Tuple[List[str], Dict[str, List[int]]]:
+    """
+    Split the plan into sentences and find every keyword in one pass.
+
+    Returns ``(sentences, keyword_hits)`` where ``keyword_hits`` maps each
+    matched lowercase keyword to the ascending indices of the sentences that
+    contain it.
+    """
+    sentences = _split_sentences(original_text)
+    hits = _scan_sentences(sentences, automaton)
+
+    keyword_hits: Dict[str, List[int]] = {}
+    for sent_idx, kw in hits:
+        keyword_hits.setdefault(kw, []).append(sent_idx)
+    return sentences, keyword_hits
+
+
+def _collect_evidence(
+    sentences: List[str],
+    keyword_hits: Dict[str, List[int]],
+    kw_lowers: List[str],
+) -> List[str]:
+    """
+    Turn the sentences matched by *kw_lowers* into evidence snippets.
 
     Strategy:
-        1. Split text into sentences (or logical segments).
-        2. For each sentence that contains a keyword, include it as evidence.
-        3. De-duplicate and clean up each snippet.
+        1. Walk the keywords in order, and each keyword's sentences in order.
+        2. De-duplicate sentences on a normalised prefix.
+        3. Trim overly long sentences to a window around the keyword.
 
     Returns a list of clean evidence strings, each a proper sentence/phrase.
     """
-    # ── Split text into sentences ────────────────────────────────────── #
+    evidence: List[str] = []
+    seen: set = set()
+
+    for kw_lower in kw_lowers:
+        for sent_idx in keyword_hits.get(kw_lower, ()):
+            sentence = sentences[sent_idx]
+
+            # Normalise for dedup: lowercase trimmed version
+            dedup_key = sentence.lower().strip()[:120]
+            if dedup_key in seen:
+                continue
+            seen.add(dedup_key)
+
+            # Trim overly long sentences to keep evidence readable
+            snippet = sentence
+            if len(snippet) > 200:
+                # Find the keyword position and take a window around it
+                idx = snippet.lower().find(kw_lower)
+                window_start = max(0, idx - 80)
+                window_end = min(len(snippet), idx + len(kw_lower) + 80)
+                snippet = snippet[window_start:window_end].strip()
+                # Clean partial words at edges
+                if window_start > 0:
+                    snippet = re.sub(r'^\S*\s', '', snippet)
+                    snippet = f"...{snippet}"
+                if window_end < len(sentence):
+                    snippet = re.sub(r'\s\S*$', '', snippet)
+                    snippet = f"{snippet}..."
+
+            evidence.append(snippet)
+
+    return evidence
+
+
+def _split_sentences(original_text: str) -> List[str]:
+    """Split plan text into cleaned sentences, skipping trivial fragments."""
     # Split on sentence-ending punctuation, numbering patterns, or newlines
     raw_sentences = re.split(
         r'(?<=[.!?])\s+|(?<=\n)\s*|\s*\n\s*|(?<=\d)\.\s+(?=[A-Z])',
@@ -310,40 +447,22 @@ def _find_evidence(text_lower: str, original_text: str, keywords: List[str]) ->
         cleaned = re.sub(r'\s+', ' ', cleaned)
         if len(cleaned) >= 15:  # skip trivial fragments
             sentences.append(cleaned)
+    return sentences
 
-    # ── Find sentences that contain keywords ─────────────────────────── #
-    evidence: List[str] = []
-    seen: set = set()
-
-    for keyword in keywords:
-        kw_lower = keyword.lower()
-        for sentence in sentences:
-            if kw_lower in sentence.lower():
-                # Normalise for dedup: lowercase trimmed version
-                dedup_key = sentence.lower().strip()[:120]
-                if dedup_key in seen:
-                    continue
-                seen.add(dedup_key)
-
-                # Trim overly long sentences to keep evidence readable
-                snippet = sentence
-                if len(snippet) > 200:
-                    # Find the keyword position and take a window around it
-                    idx = snippet.lower().find(kw_lower)
-                    window_start = max(0, idx - 80)
-                    window_end = min(len(snippet), idx + len(kw_lower) + 80)
-                    snippet = snippet[window_start:window_end].strip()
-                    # Clean partial words at edges
-                    if window_start > 0:
-                        snippet = re.sub(r'^\S*\s', '', snippet)
-                        snippet = f"...{snippet}"
-                    if window_end < len(sentence):
-                        snippet = re.sub(r'\s\S*$', '', snippet)
-                        snippet = f"{snippet}..."
-
-                evidence.append(snippet)
 
-    return evidence
+def _scan_sentences(
+    sentences: List[str],
+    automaton: "ahocorasick.Automaton",
+) -> List[Tuple[int, str]]:
+    """
+    Return ``(sentence_index, keyword)`` pairs for every distinct keyword
+    found in each sentence, in sentence order.
+    """
+    hits: List[Tuple[int, str]] = []
+    for sent_idx, sentence in enumerate(sentences):
+        found = {kw for _end, kw in automaton.iter(sentence.lower())}
+        hits.extend((sent_idx, kw) for kw in found)
+    return hits
 
 
 # --------------------------------------------------------------------------- #
@@ -19,8 +19,15 @@ generate_gap_analysis()        – Categories missing or insufficient
 build_full_report()            – One-shot helper combining everything
 """
 
-from collections import Counter
-from typing import Any, Dict, List, Optional
+import hashlib
+import logging
+import sys
+import threading
+from collections import Counter, OrderedDict
+from operator import itemgetter
+from typing import Any, Dict, List, Optional, Tuple
+
+import ahocorasick
 
 from utils.logger import app_logger
 from services.gemini_service import (
@@ -42,7 +49,10 @@ CATEGORY_WEIGHTS: Dict[str, float] = {
     "Portability":     0.05,
 }
 
-ALL_CATEGORIES = list(CATEGORY_WEIGHTS.keys())
+# Interned so that category lookups on classifier output (which hands back
+# the same interned objects, see RequirementClassifier) hit the identity
+# fast path in dict key comparison.
+ALL_CATEGORIES = [sys.intern(cat) for cat in CATEGORY_WEIGHTS]
 
 # Minimum recommended number of requirements per category
 MIN_RECOMMENDED = {
@@ -55,6 +65,11 @@ MIN_RECOMMENDED = {
     "Portability":     1,
 }
 
+# Struct-of-arrays view of the per-category constants: columns aligned with
+# ALL_CATEGORIES.
+_WEIGHT_COLUMN: Tuple[float, ...] = tuple(CATEGORY_WEIGHTS[cat] for cat in ALL_CATEGORIES)
+_MIN_RECOMMENDED_COLUMN: Tuple[int, ...] = tuple(MIN_RECOMMENDED.get(cat, 1) for cat in ALL_CATEGORIES)
+
 # --------------------------------------------------------------------------- #
 # Domain detection                                                              #
 # --------------------------------------------------------------------------- #
@@ -140,6 +155,24 @@ DOMAIN_KEYWORDS: Dict[str, List[str]] = {
     ],
 }
 
+# Flattened, pre-lowercased (keyword, domain) pairs in DOMAIN_KEYWORDS order,
+# and the keyword count per domain used for the confidence ratio.
+_DOMAIN_KW_FLAT: List[Tuple[str, str]] = [
+    (kw.lower(), domain)
+    for domain, keywords in DOMAIN_KEYWORDS.items()
+    for kw in keywords
+]
+_MAX_POSSIBLE: Dict[str, int] = {
+    domain: len(keywords) for domain, keywords in DOMAIN_KEYWORDS.items()
+}
+
+# One automaton over every domain keyword, so the keyword fallback scans the
+# text once instead of once per keyword.
+_DOMAIN_AUTOMATON = ahocorasick.Automaton()
+for _kw, _domain in _DOMAIN_KW_FLAT:
+    _DOMAIN_AUTOMATON.add_word(_kw, _kw)
+_DOMAIN_AUTOMATON.make_automaton()
+
 # Which ISO 9126 categories are *especially* critical for each domain
 DOMAIN_CRITICAL_CATEGORIES: Dict[str, Dict[str, str]] = {
     "Banking / Finance": {
@@ -223,6 +256,13 @@ DOMAIN_CRITICAL_CATEGORIES: Dict[str, Dict[str, str]] = {
 }
 
 
+# Keyword domain results keyed by a digest of the scanned text, so the cache
+# holds small result dicts rather than whole documents.
+_DOMAIN_CACHE: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+_DOMAIN_CACHE_SIZE = 32
+_DOMAIN_CACHE_LOCK = threading.Lock()
+
+
 # --------------------------------------------------------------------------- #
 # Public API                                                                    #
 # --------------------------------------------------------------------------- #
@@ -246,31 +286,37 @@ def calculate_category_scores(classified_requirements: List[Dict[str, Any]]) ->
         return {cat: _empty_category_entry(cat) for cat in ALL_CATEGORIES}
 
     total = len(classified_requirements)
-    counts = Counter(r["category"] for r in classified_requirements)
-
-    scores: Dict[str, Any] = {}
-    for cat in ALL_CATEGORIES:
-        count = counts.get(cat, 0)
-        scores[cat] = {
-            "count":          count,
-            "percentage":     round(count / total * 100, 2) if total else 0,
-            "meets_minimum":  count >= MIN_RECOMMENDED.get(cat, 1),
-            "weight":         CATEGORY_WEIGHTS[cat],
-            "min_recommended": MIN_RECOMMENDED.get(cat, 1),
+    # Counter tallies in C; known categories are then popped out in
+    # ALL_CATEGORIES order, leaving anything else the model returned
+    # behind in first-seen order
+    unknown = Counter(map(itemgetter("category"), classified_requirements))
+    counts = [unknown.pop(cat, 0) for cat in ALL_CATEGORIES]
+
+    scores: Dict[str, Any] = {
+        cat: {
+            "count":           count,
+            "percentage":      round(count / total * 100, 2),
+            "meets_minimum":   count >= min_rec,
+            "weight":          weight,
+            "min_recommended": min_rec,
         }
+        for cat, count, weight, min_rec in zip(
+            ALL_CATEGORIES, counts, _WEIGHT_COLUMN, _MIN_RECOMMENDED_COLUMN
+        )
+    }
 
     # Include any unexpected/unknown categories returned by the model
-    for cat, count in counts.items():
-        if cat not in scores:
-            scores[cat] = {
-                "count":           count,
-                "percentage":      round(count / total * 100, 2),
-                "meets_minimum":   False,
-                "weight":          0.0,
-                "min_recommended": 1,
-            }
+    for cat, count in unknown.items():
+        scores[cat] = {
+            "count":           count,
+            "percentage":      round(count / total * 100, 2),
+            "meets_minimum":   False,
+            "weight":          0.0,
+            "min_recommended": 1,
+        }
 
-    app_logger.debug(f"Category scores: { {c: s['count'] for c, s in scores.items()} }")
+    if app_logger.isEnabledFor(logging.DEBUG):
+        app_logger.debug("Category scores: %s", {c: s["count"] for c, s in scores.items()})
     return scores
 
 
@@ -321,37 +367,25 @@ def detect_domain(
     # Fallback to keyword-based detection
     app_logger.info("Using keyword-based domain detection (Gemini unavailable)")
     
-    # Combine all requirement text + raw text into one searchable blob
-    text_parts = [r.get("text", "") for r in classified_requirements]
+    # All requirement text + raw text
+    text_parts = tuple(r.get("text", "") for r in classified_requirements)
     if raw_text:
-        text_parts.append(raw_text)
-    blob = " ".join(text_parts).lower()
-
-    scores: Dict[str, int] = {}
-    for domain, keywords in DOMAIN_KEYWORDS.items():
-        hits = sum(1 for kw in keywords if kw in blob)
-        if hits > 0:
-            scores[domain] = hits
-
-    if not scores:
-        return {
-            "domain": "General",
-            "confidence": 0.0,
-            "critical_categories": {},
-            "method": "keyword",
-        }
-
-    best_domain = max(scores, key=scores.get)
-    best_hits = scores[best_domain]
-    max_possible = len(DOMAIN_KEYWORDS.get(best_domain, []))
-    confidence = round(min(best_hits / max(max_possible * 0.4, 1), 1.0), 2)
-
-    return {
-        "domain":              best_domain,
-        "confidence":          confidence,
-        "critical_categories": DOMAIN_CRITICAL_CATEGORIES.get(best_domain, {}),
-        "method":              "keyword",
-    }
+        text_parts += (raw_text,)
+
+    # Cached per text digest: re-analysing the same SRS skips the scan entirely.
+    # Copy so callers can't mutate the cached entry.
+    cache_key = _domain_cache_key(text_parts)
+    with _DOMAIN_CACHE_LOCK:
+        cached = _DOMAIN_CACHE.get(cache_key)
+        if cached is not None:
+            _DOMAIN_CACHE.move_to_end(cache_key)
+    if cached is None:
+        cached = _detect_domain_by_keywords(text_parts)
+        with _DOMAIN_CACHE_LOCK:
+            _DOMAIN_CACHE[cache_key] = cached
+            while len(_DOMAIN_CACHE) > _DOMAIN_CACHE_SIZE:
+                _DOMAIN_CACHE.popitem(last=False)
+    return dict(cached)
 
 
 def generate_recommendations(
@@ -402,7 +436,8 @@ def generate_recommendations(
     # Fallback to rule-based recommendations
     app_logger.info("Using rule-based recommendations (Gemini unavailable)")
     
-    recommendations: List[Dict[str, str]] = []
+    # (rank, recommendation) pairs; rank 0 = critical, 1 = high, 2 = medium
+    ranked: List[Tuple[int, Dict[str, str]]] = []
     domain = (domain_info or {}).get("domain", "General")
     critical_cats = (domain_info or {}).get("critical_categories", {})
     
@@ -427,21 +462,21 @@ def generate_recommendations(
         if count == 0:
             # Determine priority based on domain
             if domain_importance == "critical":
-                priority = "critical"
+                priority, rank = "critical", 0
                 suffix = (
                     f" This is *critical* for a {domain} system — "
                     f"missing {cat.lower()} requirements is a serious risk."
                 )
             elif domain_importance == "high":
-                priority = "high"
+                priority, rank = "high", 1
                 suffix = (
                     f" For a {domain} system, {cat.lower()} is highly important."
                 )
             else:
-                priority = "high"
+                priority, rank = "high", 1
                 suffix = ""
 
-            recommendations.append({
+            ranked.append((rank, {
                 "category": cat,
                 "priority": priority,
                 "message": (
@@ -449,10 +484,13 @@ def generate_recommendations(
                     f"Consider adding at least {min_rec} requirement(s) "
                     f"covering {cat.lower()} aspects.{suffix}"
                 ),
-            })
+            }))
         elif count < min_rec:
-            priority = "high" if domain_importance in ("critical", "high") else "medium"
-            recommendations.append({
+            if domain_importance in ("critical", "high"):
+                priority, rank = "high", 1
+            else:
+                priority, rank = "medium", 2
+            ranked.append((rank, {
                 "category": cat,
                 "priority": priority,
                 "message": (
@@ -465,10 +503,10 @@ def generate_recommendations(
                         else ""
                     )
                 ),
-            })
+            }))
         # NEW: Check if domain-critical category has insufficient coverage
         elif domain_importance == "critical" and (count < critical_min_count or percentage < critical_min_pct):
-            recommendations.append({
+            ranked.append((0, {
                 "category": cat,
                 "priority": "critical",
                 "message": (
@@ -477,9 +515,9 @@ def generate_recommendations(
                     f"requirements should represent at least {critical_min_pct}% of the specification. "
                     f"Consider adding more {cat.lower()} requirements to reduce project risk."
                 ),
-            })
+            }))
         elif domain_importance == "high" and (count < high_min_count or percentage < high_min_pct):
-            recommendations.append({
+            ranked.append((1, {
                 "category": cat,
                 "priority": "high",
                 "message": (
@@ -487,11 +525,11 @@ def generate_recommendations(
                     f"({percentage:.1f}% of total). Consider strengthening {cat.lower()} coverage "
                     f"to at least {high_min_count} requirements."
                 ),
-            })
+            }))
 
-    # Sort: critical → high → medium → low
-    priority_order = {"critical": 0, "high": 1, "medium": 2, "low": 3}
-    recommendations.sort(key=lambda r: priority_order.get(r["priority"], 99))
+    # Sort: critical → high → medium (stable, so category order breaks ties)
+    ranked.sort(key=itemgetter(0))
+    recommendations = [rec for _rank, rec in ranked]
 
     app_logger.info(f"Generated {len(recommendations)} recommendations (domain={domain})")
     return recommendations
@@ -506,30 +544,7 @@ def generate_gap_analysis(
     Returns:
         List of gap dicts: {category, gap_type, count, min_required, shortage}
     """
-    gaps = []
-    for cat in ALL_CATEGORIES:
-        data = category_scores.get(cat, {})
-        count = data.get("count", 0)
-        min_rec = data.get("min_recommended", 1)
-
-        if count == 0:
-            gaps.append({
-                "category":     cat,
-                "gap_type":     "missing",
-                "count":        0,
-                "min_required": min_rec,
-                "shortage":     min_rec,
-            })
-        elif count < min_rec:
-            gaps.append({
-                "category":     cat,
-                "gap_type":     "insufficient",
-                "count":        count,
-                "min_required": min_rec,
-                "shortage":     min_rec - count,
-            })
-
-    return gaps
+    return _summarise_categories(category_scores)[2]
 
 
 def build_full_report(
@@ -563,16 +578,11 @@ def build_full_report(
     category_scores = calculate_category_scores(classified_requirements)
     domain_info = detect_domain(classified_requirements, raw_text)
     recommendations = generate_recommendations(category_scores, domain_info)
-    gap_analysis = generate_gap_analysis(category_scores)
-
-    categories_present = [
-        cat for cat in ALL_CATEGORIES if category_scores.get(cat, {}).get("count", 0) > 0
-    ]
-    categories_missing = [cat for cat in ALL_CATEGORIES if cat not in categories_present]
+    categories_present, categories_missing, gap_analysis = _summarise_categories(category_scores)
 
     app_logger.info(
-        f"SRS summary built: {total} reqs, domain={domain_info['domain']}, "
-        f"present={len(categories_present)}/{len(ALL_CATEGORIES)}"
+        "SRS summary built: %d reqs, domain=%s, present=%d/%d",
+        total, domain_info["domain"], len(categories_present), len(ALL_CATEGORIES),
     )
 
     return {
@@ -590,6 +600,96 @@ def build_full_report(
 # Helpers                                                                       #
 # --------------------------------------------------------------------------- #
 
+def _domain_cache_key(text_parts: Tuple[str, ...]) -> bytes:
+    """Digest of the text parts scanned by _detect_domain_by_keywords()."""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in text_parts:
+        # Length-prefix each part so ("ab", "c") and ("a", "bc") differ.
+        data = part.encode("utf-8", "surrogatepass")
+        digest.update(len(data).to_bytes(8, "little"))
+        digest.update(data)
+    return digest.digest()
+
+
+def _detect_domain_by_keywords(text_parts: Tuple[str, ...]) -> Dict[str, Any]:
+    """Keyword fallback of detect_domain() over the raw (un-lowered) text parts."""
+    # Distinct keywords present anywhere (overlapping matches included).
+    # The parts are joined with spaces and scanned once, so a
+    # keyword may span two adjacent parts. Searching ASCII-encoded bytes
+    # instead was considered: the automaton pass already dominates, and
+    # encode("ascii", "ignore") would splice words across dropped characters
+    # ("e‑commerce" with a non-ASCII hyphen → "ecommerce").
+    blob = " ".join(text_parts).lower()
+    found = {kw for _end, kw in _DOMAIN_AUTOMATON.iter(blob)}
+
+    scores: Dict[str, int] = {}
+    for kw, domain in _DOMAIN_KW_FLAT:
+        if kw in found:
+            scores[domain] = scores.get(domain, 0) + 1
+
+    if not scores:
+        return {
+            "domain": "General",
+            "confidence": 0.0,
+            "critical_categories": {},
+            "method": "keyword",
+        }
+
+    best_domain = max(scores, key=scores.get)
+    best_hits = scores[best_domain]
+    max_possible = _MAX_POSSIBLE[best_domain]
+    confidence = round(min(best_hits / max(max_possible * 0.4, 1), 1.0), 2)
+
+    return {
+        "domain":              best_domain,
+        "confidence":          confidence,
+        "critical_categories": DOMAIN_CRITICAL_CATEGORIES.get(best_domain, {}),
+        "method":              "keyword",
+    }
+
+
+def _summarise_categories(
+    category_scores: Dict[str, Any],
+) -> Tuple[List[str], List[str], List[Dict[str, Any]]]:
+    """
+    Single pass over ALL_CATEGORIES producing the present list, the missing
+    list and the gap analysis together (see generate_gap_analysis()).
+
+    Returns:
+        (categories_present, categories_missing, gaps)
+    """
+    present: List[str] = []
+    missing: List[str] = []
+    gaps: List[Dict[str, Any]] = []
+    for cat in ALL_CATEGORIES:
+        data = category_scores.get(cat, {})
+        count = data.get("count", 0)
+        min_rec = data.get("min_recommended", 1)
+
+        if count == 0:
+            missing.append(cat)
+            gaps.append({
+                "category":     cat,
+                "gap_type":     "missing",
+                "count":        0,
+                "min_required": min_rec,
+                "shortage":     min_rec,
+            })
+            continue
+
+        present.append(cat)
+        if count < min_rec:
+            gaps.append({
+                "category":     cat,
+                "gap_type":     "insufficient",
+                "count":        count,
+                "min_required": min_rec,
+                "shortage":     min_rec - count,
+            })
+
+    return present, missing, gaps
+
+
 def _empty_category_entry(cat: str) -> Dict[str, Any]:
     return {
         "count":           0,
@@ -11,8 +11,13 @@ Strategy
 4. Return a structured list ready for the classifier.
 """
 
+import os
 import re
-from typing import Dict, Any, List
+import string
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, Iterator, List, Optional, Set
+
+import ahocorasick
 
 from utils.logger import app_logger
 
@@ -34,10 +39,40 @@ WEAK_KEYWORDS = [
     "verifies", "maintains", "manages", "implements", "performs",
 ]
 
+# One automaton over both lists; payload is the keyword's index in
+# STRONG_KEYWORDS + WEAK_KEYWORDS, so indices below len(STRONG_KEYWORDS)
+# are strong signals and list order is recoverable by sorting.
+_ALL_KEYWORDS = STRONG_KEYWORDS + WEAK_KEYWORDS
+_KEYWORD_AUTOMATON = ahocorasick.Automaton()
+for _idx, _kw in enumerate(_ALL_KEYWORDS):
+    _KEYWORD_AUTOMATON.add_word(_kw, _idx)
+_KEYWORD_AUTOMATON.make_automaton()
+
+# Every byte value except the ASCII letters, for _count_alpha()
+_NON_ALPHA_BYTES = bytes(b for b in range(256) if b not in string.ascii_letters.encode())
+
 # Minimum / maximum meaningful requirement lengths (characters)
 MIN_LENGTH = 20
 MAX_LENGTH = 500
 
+# List-item prefix at the start of a line, in bullet → number → letter order
+# so nested markers such as "- 1. a. " are removed in one match. A marker
+# may also end the line: an empty list item ("1.", "-") yields no candidate
+# and is not counted in total_candidates, wherever it appears.
+_MARKER_GAP = r"(?:\s+|$)"
+_LIST_PREFIX_RE = re.compile(
+    r"\s*(?:"
+    rf"[\-\•\*]{_MARKER_GAP}(?:\d+[\.\)]{_MARKER_GAP})?(?:[a-zA-Z][\.\)]{_MARKER_GAP})?"  # bullet [number] [letter]
+    rf"|\d+[\.\)]{_MARKER_GAP}(?:[a-zA-Z][\.\)]{_MARKER_GAP})?"                      # number [letter]
+    rf"|[a-zA-Z][\.\)]{_MARKER_GAP}"                                                # letter (a. b.)
+    r")"
+)
+# Sentence-ending punctuation followed by whitespace (within a line)
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+# Same boundary without the lookbehind; used only to detect whether a line
+# has one at all, which is much cheaper than splitting
+_SENTENCE_END_RE = re.compile(r"[.!?]\s")
+
 
 # --------------------------------------------------------------------------- #
 # Public API                                                                    #
@@ -58,18 +93,77 @@ def extract_requirements(text: str) -> Dict[str, Any]:
             "extraction_stats": { strong_keyword_matches, weak_keyword_matches, filtered_out }
         }
     """
+    return _extract(text, set())
+
+
+def extract_requirements_batch(
+    texts: List[str],
+    shared_seen: Optional[Set[str]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Run extract_requirements() over several documents.
+
+    Args:
+        texts:       Cleaned plain-text strings, one per document.
+        shared_seen: Optional set used to de-duplicate candidates *across*
+                     documents: a sentence already seen in an earlier text
+                     (or pre-seeded by the caller) is skipped. The set is
+                     updated in place, so it can be carried between batches.
+                     When omitted each document is de-duplicated on its own.
+
+    Returns:
+        One extract_requirements()-shaped result per input text, in order.
+    """
+    if shared_seen is None:
+        return [_extract(text, set()) for text in texts]
+    return [_extract(text, shared_seen) for text in texts]
+
+
+def extract_requirements_parallel(
+    texts: List[str],
+    max_workers: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Run extract_requirements() over a corpus of documents in worker processes.
+
+    Extraction is CPU-bound and independent per document, so whole documents
+    are distributed across a process pool (sidestepping the GIL). The keyword
+    automaton and regexes are module globals, built once when each worker
+    imports this module, not per task. Documents are de-duplicated on their
+    own (no shared_seen across processes).
+
+    Args:
+        texts:       Cleaned plain-text strings, one per document.
+        max_workers: Pool size (defaults to os.cpu_count()).
+
+    Returns:
+        One extract_requirements()-shaped result per input text, in input order.
+    """
+    if len(texts) < 2:
+        return extract_requirements_batch(texts)
+
+    workers = min(max_workers or os.cpu_count() or 1, len(texts))
+    # Several chunks per worker keeps late workers fed without paying
+    # one round-trip per document on large corpora
+    chunksize = max(1, len(texts) // (4 * workers))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(extract_requirements, texts, chunksize=chunksize))
+
+
+def _extract(text: str, seen: Set[str]) -> Dict[str, Any]:
+    """Body of extract_requirements(); ``seen`` holds already-yielded candidates."""
     if not text or not text.strip():
         return _empty_result()
 
-    candidates = _split_into_candidates(text)
-    app_logger.debug(f"Candidates after split: {len(candidates)}")
-
     requirements = []
     stats = {"strong_keyword_matches": 0, "weak_keyword_matches": 0, "filtered_out": 0}
+    total_candidates = 0
 
-    for idx, candidate in enumerate(candidates):
+    # Candidates stream straight from the splitter into evaluation, so the
+    # full candidate list is never held alongside the results.
+    for idx, candidate in enumerate(_iter_candidates(text, seen)):
+        total_candidates += 1
         result = _evaluate_candidate(candidate, idx)
-
         if result is None:
             stats["filtered_out"] += 1
             continue
@@ -81,9 +175,10 @@ def extract_requirements(text: str) -> Dict[str, Any]:
 
         requirements.append(result)
 
+    app_logger.debug("Candidates after split: %d", total_candidates)
     app_logger.info(
         f"Requirement extraction complete | "
-        f"found={len(requirements)} / {len(candidates)} candidates | "
+        f"found={len(requirements)} / {total_candidates} candidates | "
         f"strong={stats['strong_keyword_matches']} weak={stats['weak_keyword_matches']} "
         f"filtered={stats['filtered_out']}"
     )
@@ -91,7 +186,7 @@ def extract_requirements(text: str) -> Dict[str, Any]:
     return {
         "requirements": requirements,
         "total_found": len(requirements),
-        "total_candidates": len(candidates),
+        "total_candidates": total_candidates,
         "extraction_stats": stats,
     }
 
@@ -113,9 +208,9 @@ def get_requirement_texts(extraction_result: Dict[str, Any]) -> List[str]:
 # Splitting                                                                     #
 # --------------------------------------------------------------------------- #
 
-def _split_into_candidates(text: str) -> List[str]:
+def _iter_candidates(text: str, seen: Set[str]) -> Iterator[str]:
     """
-    Split a document into candidate requirement sentences.
+    Split a document into candidate requirement sentences, lazily.
 
     Handles:
     - Numbered lists:  "1. The system shall …"
@@ -123,29 +218,27 @@ def _split_into_candidates(text: str) -> List[str]:
     - Regular sentences terminated by . ! ?
     - Line-based requirements (one per line)
 
-    Returns:
-        Deduplicated list of stripped non-empty strings.
-    """
-    # First, try splitting on common list-item patterns + sentence boundaries
-    # Replace bullet/numbering prefixes with a normalised delimiter
-    text = re.sub(r"(?m)^\s*[\-\•\*]\s+", "\n", text)            # bullets
-    text = re.sub(r"(?m)^\s*\d+[\.\)]\s+", "\n", text)           # numbered lists
-    text = re.sub(r"(?m)^\s*[a-zA-Z][\.\)]\s+", "\n", text)      # lettered lists (a. b.)
-
-    # Split on sentence-ending punctuation OR newlines
-    raw_parts = re.split(r"(?<=[.!?])\s+|\n", text)
+    Candidates already in ``seen`` are skipped; new ones are added to it.
 
-    candidates = []
-    seen = set()
-    for part in raw_parts:
-        part = part.strip()
-        # Normalise internal whitespace
-        part = re.sub(r"\s+", " ", part)
-        if part and part not in seen:
-            candidates.append(part)
-            seen.add(part)
-
-    return candidates
+    Yields:
+        Deduplicated stripped non-empty strings, in document order.
+    """
+    # Every newline is a candidate boundary, so the text is scanned line by
+    # line: strip any list prefix, then split the line on sentence endings.
+    for line in text.split("\n"):
+        prefix = _LIST_PREFIX_RE.match(line)
+        if prefix:
+            line = line[prefix.end():]
+
+        # Most lines hold a single sentence (or list item); only split the
+        # ones that actually contain an internal sentence boundary
+        parts = _SENTENCE_SPLIT_RE.split(line) if _SENTENCE_END_RE.search(line) else (line,)
+        for part in parts:
+            # Strip and normalise internal whitespace
+            part = " ".join(part.split())
+            if part and part not in seen:
+                seen.add(part)
+                yield part
 
 
 # --------------------------------------------------------------------------- #
@@ -168,14 +261,20 @@ def _evaluate_candidate(text: str, index: int) -> Dict[str, Any] | None:
         return None
 
     # --- reject mostly-numeric or mostly-special-char strings ---
-    alpha_ratio = sum(c.isalpha() for c in text) / len(text)
+    alpha_ratio = _count_alpha(text) / len(text)
     if alpha_ratio < 0.4:
         return None
 
     text_lower = text.lower()
 
+    # --- single keyword pass: strong and weak matches together ---
+    found = sorted({idx for _end, idx in _KEYWORD_AUTOMATON.iter(text_lower)})
+    if not found:
+        # No keyword — discard
+        return None
+
     # --- strong keyword check ---
-    matched_strong = [kw for kw in STRONG_KEYWORDS if kw in text_lower]
+    matched_strong = [_ALL_KEYWORDS[idx] for idx in found if idx < len(STRONG_KEYWORDS)]
     if matched_strong:
         return {
             "text": text,
@@ -185,25 +284,33 @@ def _evaluate_candidate(text: str, index: int) -> Dict[str, Any] | None:
             "matched_keywords": matched_strong,
         }
 
-    # --- weak keyword check ---
-    matched_weak = [kw for kw in WEAK_KEYWORDS if kw in text_lower]
-    if matched_weak:
-        return {
-            "text": text,
-            "source_index": index,
-            "has_keyword": True,
-            "keyword_strength": "weak",
-            "matched_keywords": matched_weak,
-        }
-
-    # No keyword — discard
-    return None
+    # --- weak keyword check (only weak indices remain) ---
+    return {
+        "text": text,
+        "source_index": index,
+        "has_keyword": True,
+        "keyword_strength": "weak",
+        "matched_keywords": [_ALL_KEYWORDS[idx] for idx in found],
+    }
 
 
 # --------------------------------------------------------------------------- #
 # Helpers                                                                       #
 # --------------------------------------------------------------------------- #
 
+def _count_alpha(text: str) -> int:
+    """
+    Number of alphabetic characters in ``text`` (same as str.isalpha per char).
+
+    ASCII text (the common case) is counted by deleting every non-letter byte
+    with bytes.translate, a single table-driven C loop; anything else falls
+    back to map(str.isalpha, …).
+    """
+    if text.isascii():
+        return len(text.encode("ascii").translate(None, _NON_ALPHA_BYTES))
+    return sum(map(str.isalpha, text))
+
+
 def _empty_result() -> Dict[str, Any]:
     return {
         "requirements": [],
@@ -5,8 +5,14 @@ Shared pytest fixtures available to all test modules in this package.
 
 Fixtures
 --------
-app       — configured Flask application in TESTING mode
-client    — test client for the Flask app
+model_ready — loads the classifier model once per session
+app         — configured Flask application in TESTING mode
+client      — test client for the Flask app
+client_class — exposes `client` as self.client on test classes
+
+Markers
+-------
+slow        — skipped unless pytest is run with --runslow
 
 Usage in tests
 --------------
@@ -15,32 +21,50 @@ Usage in tests
         assert resp.status_code == 200
 """
 
-import os
-import sys
 import pytest
 
-# Make sure imports resolve from the backend root
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from tests.shared_app import get_test_app
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--runslow", action="store_true", default=False,
+        help="also run tests marked @pytest.mark.slow (large-document stress tests)",
+    )
+
 
-from app import create_app
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--runslow"):
+        return
+    skip_slow = pytest.mark.skip(reason="slow test: pass --runslow to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
 
 
 @pytest.fixture(scope="session")
-def app():
+def model_ready():
+    """Import the classifier singleton, which unpickles the model as a side effect."""
+    import services.classifier  # noqa: F401
+
+
+@pytest.fixture(scope="session")
+def app(model_ready):
     """
-    Create a single Flask application instance for the entire test session.
-    Using session scope avoids re-loading the ML model on every test class.
+    The single Flask application instance for the entire test session.
+    Using session scope avoids rebuilding the app on every test class.
     """
-    flask_app = create_app()
-    flask_app.config.update(
-        TESTING=True,
-        # Use an in-memory-style DB path so tests don't pollute the dev database.
-        # The DB is still file-backed so concurrent write safety is maintained.
-    )
-    yield flask_app
+    # One app per process (per xdist worker); see tests/shared_app.py.
+    yield get_test_app()
 
 
 @pytest.fixture(scope="session")
 def client(app):
     """Return a test client that reuses the session-scoped app."""
     return app.test_client()
+
+
+@pytest.fixture(scope="class")
+def client_class(request, client):
+    """Attach the session client to the requesting class as ``self.client``."""
+    request.cls.client = client
@@ -0,0 +1,63 @@
+"""
+tests/docx_fixtures.py
+======================
+Build minimal DOCX uploads for the API tests without python-docx.
+
+python-docx spends ~20 ms per document loading and re-serialising its
+default template. The upload/analyze tests only need a package that the
+backend's extractor can read, so the parts are written straight into a
+zip from string templates. Results are cached per paragraph tuple.
+
+The extractor itself is still exercised against real python-docx output
+in test_document_processor.py.
+"""
+
+import io
+import zipfile
+from functools import lru_cache
+from xml.sax.saxutils import escape
+
+_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/word/document.xml" ContentType="application/'
+    'vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+    '</Types>'
+)
+
+_PACKAGE_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/'
+    'relationships/officeDocument" Target="word/document.xml"/>'
+    '</Relationships>'
+)
+
+_DOCUMENT_HEAD = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+    '<w:body>'
+)
+_DOCUMENT_TAIL = '<w:sectPr/></w:body></w:document>'
+
+
+def make_docx(paragraphs) -> io.BytesIO:
+    """Return a fresh, rewound buffer holding a DOCX with *paragraphs*."""
+    return io.BytesIO(docx_bytes(tuple(paragraphs)))
+
+
+@lru_cache(maxsize=None)
+def docx_bytes(paragraphs: tuple) -> bytes:
+    """Serialise each distinct paragraph tuple once per test process."""
+    body = "".join(
+        f'<w:p><w:r><w:t xml:space="preserve">{escape(p)}</w:t></w:r></w:p>'
+        for p in paragraphs
+    )
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_STORED) as zf:
+        zf.writestr("[Content_Types].xml", _CONTENT_TYPES)
+        zf.writestr("_rels/.rels", _PACKAGE_RELS)
+        zf.writestr("word/document.xml", _DOCUMENT_HEAD + body + _DOCUMENT_TAIL)
+    return buf.getvalue()
@@ -0,0 +1,104 @@
+"""
+tests/shared_app.py
+===================
+One Flask application per test process, shared by every test module.
+
+The pytest fixtures in conftest.py go through get_test_app(), so a full
+pytest run builds the app (database init, blueprints, limiter) exactly
+once per process.
+
+Every test process gets its own throwaway upload folder, SQLite database
+and log file, so test runs never write into the tracked uploads/ and data/
+directories, and under pytest-xdist classes can be spread across workers
+(--dist=loadscope) without sharing files or write locks.
+"""
+
+import atexit
+import logging
+import os
+import shutil
+import tempfile
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def get_test_app():
+    """Return the process-wide Flask app, configured for TESTING."""
+    from app import create_app
+
+    app = create_app()
+    app.config["TESTING"] = True
+    _quiet_request_logging(app)
+    # One throwaway request pays the first-call costs (lazy imports in the
+    # request path, sklearn's first predict) here instead of inside
+    # whichever test happens to run first — on every xdist worker.
+    app.test_client().post("/api/predict", json={"text": "The system shall start."})
+    return app
+
+
+def _quiet_request_logging(app) -> None:
+    """
+    Drop per-request INFO/DEBUG records while the tests drive the app.
+
+    The app logger is DEBUG with a stdout and a rotating-file handler, so
+    every request formatted several records and appended them to
+    data/app.log. Warnings and errors still come through.
+    """
+    from utils.logger import app_logger
+
+    app_logger.setLevel(logging.WARNING)
+    app.logger.setLevel(logging.WARNING)
+    logging.getLogger("werkzeug").setLevel(logging.ERROR)
+
+
+def _isolate_storage(worker: str) -> None:
+    """Point uploads/, the SQLite DB and the log at a per-process temp dir."""
+    from config import Config
+
+    root = tempfile.mkdtemp(prefix=f"qualitymapai-{worker}-")
+    atexit.register(shutil.rmtree, root, ignore_errors=True)
+    Config.UPLOAD_FOLDER = os.path.join(root, "uploads")
+    Config.DATA_FOLDER = os.path.join(root, "data")
+    Config.DATABASE_PATH = os.path.join(root, "data", "quality_assurance.db")
+    Config.LOG_FILE = os.path.join(root, "data", "app.log")
+    _redirect_log_file(Config.LOG_FILE)
+
+
+def _redirect_log_file(log_file: str) -> None:
+    """
+    Point the app logger's rotating file handler at *log_file*.
+
+    utils.logger opens data/app.log at import, before the tests can change
+    Config. RotatingFileHandler is not multi-process safe: concurrent
+    workers rolling over the same file lose or clobber records.
+    """
+    from logging.handlers import RotatingFileHandler
+    from utils.logger import app_logger
+
+    listener = getattr(app_logger, "queue_listener", None)
+    if listener is None:
+        return
+
+    os.makedirs(os.path.dirname(log_file), exist_ok=True)
+    handlers, replaced = [], []
+    for handler in listener.handlers:
+        if isinstance(handler, RotatingFileHandler):
+            replaced.append(handler)
+            handler_copy = RotatingFileHandler(
+                log_file, maxBytes=handler.maxBytes, backupCount=handler.backupCount
+            )
+            handler_copy.setFormatter(handler.formatter)
+            handler = handler_copy
+        handlers.append(handler)
+    # The listener thread reads .handlers per record; swapping the tuple is
+    # atomic, and the old handlers are closed only once they are unreachable
+    listener.handlers = tuple(handlers)
+    for handler in replaced:
+        handler.close()
+
+
+# Isolate at import, not in get_test_app(): conftest imports this module
+# before any test or fixture (e.g. the model load) starts logging. Plain (non-xdist) runs
+# are isolated too, under the name "main".
+_WORKER = os.environ.get("PYTEST_XDIST_WORKER", "main")
+_isolate_storage(_WORKER)
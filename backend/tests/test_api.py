@@ -10,256 +10,211 @@ Run from backend/ directory:
 """
 
 import io
-import json
 import os
 import sys
-import unittest
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import pytest
 
-from app import create_app
+if __name__ == "__main__":  # standalone run; under pytest backend/ is already on sys.path
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from tests.docx_fixtures import docx_bytes
 
-class TestHealthEndpoint(unittest.TestCase):
 
-    def setUp(self):
-        self.app = create_app()
-        self.app.config["TESTING"] = True
-        self.client = self.app.test_client()
+@pytest.fixture(scope="class")
+def health_response(request, client):
+    """One GET /api/health shared by a class's status and body assertions."""
+    request.cls.health_resp = client.get("/api/health")
+    request.cls.health_body = request.cls.health_resp.get_json()
+
+
+@pytest.fixture(scope="class")
+def predict_batch(request, client):
+    """Classify a class's PROBE_TEXTS with a single batched POST /api/predict."""
+    cls = request.cls
+    resp = client.post("/api/predict", json={"texts": cls.PROBE_TEXTS})
+    cls.batch_status = resp.status_code
+    cls.batch_data = resp.get_json()
+    cls.results_by_text = {r["text"]: r for r in cls.batch_data.get("results", [])}
+
+
+@pytest.mark.usefixtures("client_class", "health_response")
+class TestHealthEndpoint:
 
     def test_health_returns_200(self):
-        resp = self.client.get("/api/health")
-        self.assertEqual(resp.status_code, 200)
+        assert self.health_resp.status_code == 200
 
     def test_health_body(self):
-        resp = self.client.get("/api/health")
-        data = json.loads(resp.data)
-        self.assertEqual(data["status"], "ok")
-        self.assertIn("model", data)
-        self.assertIn("accuracy", data)
+        assert self.health_body["status"] == "ok"
+        assert "model" in self.health_body
+        assert "accuracy" in self.health_body
 
     def test_404_on_unknown_endpoint(self):
         resp = self.client.get("/api/does_not_exist")
-        self.assertEqual(resp.status_code, 404)
-        data = json.loads(resp.data)
-        self.assertFalse(data["success"])
+        assert resp.status_code == 404
+        data = resp.get_json()
+        assert not data["success"]
 
 
-class TestUploadEndpoint(unittest.TestCase):
+@pytest.mark.usefixtures("client_class")
+class TestUploadEndpoint:
 
-    def setUp(self):
-        self.app = create_app()
-        self.app.config["TESTING"] = True
-        self.client = self.app.test_client()
+    UPLOAD_DOCX = docx_bytes((
+        "The system shall log all user authentication events.",
+        "All passwords must be hashed using bcrypt.",
+        "The application should maintain 99.9% uptime.",
+    ))
 
     def test_upload_no_file_returns_400(self):
         resp = self.client.post("/api/upload")
-        self.assertEqual(resp.status_code, 400)
-        data = json.loads(resp.data)
-        self.assertFalse(data["success"])
+        assert resp.status_code == 400
+        data = resp.get_json()
+        assert not data["success"]
 
     def test_upload_wrong_type_returns_400(self):
         """Uploading a .txt file should be rejected."""
         data = {"file": (io.BytesIO(b"hello world"), "test.txt")}
         resp = self.client.post("/api/upload", data=data,
                                 content_type="multipart/form-data")
-        self.assertEqual(resp.status_code, 400)
-        body = json.loads(resp.data)
-        self.assertFalse(body["success"])
+        assert resp.status_code == 400
+        body = resp.get_json()
+        assert not body["success"]
 
     def test_upload_valid_docx(self):
-        """Build a minimal DOCX in memory and upload it."""
-        try:
-            from docx import Document as DocxDocument
-
-            doc = DocxDocument()
-            doc.add_paragraph("The system shall log all user authentication events.")
-            doc.add_paragraph("All passwords must be hashed using bcrypt.")
-            doc.add_paragraph("The application should maintain 99.9% uptime.")
-
-            buf = io.BytesIO()
-            doc.save(buf)
-            buf.seek(0)
-
-            data = {"file": (buf, "test_requirements.docx")}
-            resp = self.client.post("/api/upload", data=data,
-                                    content_type="multipart/form-data")
-            self.assertEqual(resp.status_code, 200)
-            body = json.loads(resp.data)
-            self.assertTrue(body["success"])
-            self.assertIn("file_id", body)
-            self.assertEqual(body["file_type"], "docx")
-            # file_id available on self for any follow-up assertions in setUp
-            self._uploaded_file_id = body["file_id"]
-        except ImportError:
-            self.skipTest("python-docx not installed")
+        """Upload the class's minimal DOCX."""
+        data = {"file": (io.BytesIO(self.UPLOAD_DOCX), "test_requirements.docx")}
+        resp = self.client.post("/api/upload", data=data,
+                                content_type="multipart/form-data")
+        assert resp.status_code == 200
+        body = resp.get_json()
+        assert body["success"]
+        assert "file_id" in body
+        assert body["file_type"] == "docx"
 
     def test_upload_empty_filename_returns_400(self):
         data = {"file": (io.BytesIO(b""), "")}
         resp = self.client.post("/api/upload", data=data,
                                 content_type="multipart/form-data")
-        self.assertIn(resp.status_code, [400, 500])
+        assert resp.status_code in [400, 500]
 
 
-class TestPredictEndpoint(unittest.TestCase):
+@pytest.mark.usefixtures("client_class", "predict_batch")
+class TestPredictEndpoint:
 
-    def setUp(self):
-        self.app = create_app()
-        self.app.config["TESTING"] = True
-        self.client = self.app.test_client()
+    # Spot-check texts, classified with a single batched POST per class
+    PROBE_TEXTS = [
+        "The system must respond in under 2 seconds.",
+        "Users shall be able to reset their password.",
+        "All data must be backed up every 24 hours.",
+        "The system shall authenticate users before granting access.",
+    ]
 
     def test_predict_single_text(self):
         payload = {"text": "The system shall encrypt all user passwords using AES-256."}
-        resp = self.client.post("/api/predict",
-                                data=json.dumps(payload),
-                                content_type="application/json")
-        self.assertEqual(resp.status_code, 200)
-        data = json.loads(resp.data)
-        self.assertTrue(data["success"])
-        self.assertEqual(data["count"], 1)
-        self.assertIn("category", data["results"][0])
+        resp = self.client.post("/api/predict", json=payload)
+        assert resp.status_code == 200
+        data = resp.get_json()
+        assert data["success"]
+        assert data["count"] == 1
+        assert "category" in data["results"][0]
 
     def test_predict_batch_texts(self):
-        payload = {"texts": [
-            "The system must respond in under 2 seconds.",
-            "Users shall be able to reset their password.",
-            "All data must be backed up every 24 hours.",
-        ]}
-        resp = self.client.post("/api/predict",
-                                data=json.dumps(payload),
-                                content_type="application/json")
-        self.assertEqual(resp.status_code, 200)
-        data = json.loads(resp.data)
-        self.assertEqual(data["count"], 3)
+        assert self.batch_status == 200
+        assert self.batch_data["success"]
+        assert self.batch_data["count"] == len(self.PROBE_TEXTS)
+        assert set(self.results_by_text) == set(self.PROBE_TEXTS)
 
     def test_predict_missing_body_returns_400(self):
         resp = self.client.post("/api/predict")
-        self.assertEqual(resp.status_code, 400)
+        assert resp.status_code == 400
 
     def test_predict_empty_texts_list_returns_400(self):
         payload = {"texts": []}
-        resp = self.client.post("/api/predict",
-                                data=json.dumps(payload),
-                                content_type="application/json")
-        self.assertEqual(resp.status_code, 400)
+        resp = self.client.post("/api/predict", json=payload)
+        assert resp.status_code == 400
 
     def test_predict_confidence_in_range(self):
-        payload = {"text": "The system shall authenticate users before granting access."}
-        resp = self.client.post("/api/predict",
-                                data=json.dumps(payload),
-                                content_type="application/json")
-        data = json.loads(resp.data)
-        confidence = data["results"][0]["confidence"]
-        self.assertGreaterEqual(confidence, 0)
-        self.assertLessEqual(confidence, 100)
-
+        assert len(self.results_by_text) == len(self.PROBE_TEXTS)
+        for text, result in self.results_by_text.items():
+            assert 0 <= result["confidence"] <= 100, text
 
-class TestReportEndpoint(unittest.TestCase):
 
-    def setUp(self):
-        self.app = create_app()
-        self.app.config["TESTING"] = True
-        self.client = self.app.test_client()
+@pytest.mark.usefixtures("client_class")
+class TestReportEndpoint:
 
     def test_report_unknown_id_returns_404(self):
         resp = self.client.get("/api/report/nonexistent_id_xyz")
-        self.assertEqual(resp.status_code, 404)
-        data = json.loads(resp.data)
-        self.assertFalse(data["success"])
+        assert resp.status_code == 404
+        data = resp.get_json()
+        assert not data["success"]
 
 
-class TestAnalyzeEndpoint(unittest.TestCase):
+@pytest.mark.usefixtures("client_class")
+class TestAnalyzeEndpoint:
 
-    def setUp(self):
-        self.app = create_app()
-        self.app.config["TESTING"] = True
-        self.client = self.app.test_client()
+    UPLOAD_DOCX = docx_bytes((
+        "The system shall authenticate all users using a secure login mechanism.",
+        "All passwords must be stored using bcrypt hashing with a salt.",
+        "The application shall support a minimum of 500 concurrent sessions.",
+        "The system must respond to all API requests within 3 seconds.",
+        "Users shall be able to upload documents up to 10 MB in size.",
+        "The system should provide an audit log of all administrative actions.",
+        "The application shall be deployable on Linux and Windows platforms.",
+        "All data transmissions shall be encrypted using TLS 1.3.",
+    ))
 
     def test_analyze_missing_file_id_returns_400(self):
-        resp = self.client.post("/api/analyze",
-                                data=json.dumps({}),
-                                content_type="application/json")
-        self.assertEqual(resp.status_code, 400)
+        resp = self.client.post("/api/analyze", json={})
+        assert resp.status_code == 400
 
     def test_analyze_unknown_file_id_returns_404(self):
-        resp = self.client.post("/api/analyze",
-                                data=json.dumps({"file_id": "unknown_xyz_000"}),
-                                content_type="application/json")
-        self.assertEqual(resp.status_code, 404)
+        resp = self.client.post("/api/analyze", json={"file_id": "unknown_xyz_000"})
+        assert resp.status_code == 404
 
     def test_full_pipeline_docx(self):
         """Upload a DOCX then analyze it end-to-end."""
-        try:
-            from docx import Document as DocxDocument
-
-            doc = DocxDocument()
-            requirements = [
-                "The system shall authenticate all users using a secure login mechanism.",
-                "All passwords must be stored using bcrypt hashing with a salt.",
-                "The application shall support a minimum of 500 concurrent sessions.",
-                "The system must respond to all API requests within 3 seconds.",
-                "Users shall be able to upload documents up to 10 MB in size.",
-                "The system should provide an audit log of all administrative actions.",
-                "The application shall be deployable on Linux and Windows platforms.",
-                "All data transmissions shall be encrypted using TLS 1.3.",
-            ]
-            for req in requirements:
-                doc.add_paragraph(req)
-
-            buf = io.BytesIO()
-            doc.save(buf)
-            buf.seek(0)
-
-            # 1. Upload
-            upload_resp = self.client.post(
-                "/api/upload",
-                data={"file": (buf, "e2e_test.docx")},
-                content_type="multipart/form-data",
-            )
-            self.assertEqual(upload_resp.status_code, 200, upload_resp.data)
-            file_id = json.loads(upload_resp.data)["file_id"]
-
-            # 2. Analyze
-            analyze_resp = self.client.post(
-                "/api/analyze",
-                data=json.dumps({"file_id": file_id}),
-                content_type="application/json",
-            )
-            self.assertEqual(analyze_resp.status_code, 200, analyze_resp.data)
-            analysis = json.loads(analyze_resp.data)
-            self.assertTrue(analysis["success"])
-            self.assertGreater(analysis["total_requirements"], 0)
-            self.assertIn("domain", analysis)
-            self.assertIn("category_scores", analysis)
-            self.assertIn("recommendations", analysis)
-
-            # 3. Fetch report
-            report_resp = self.client.get(f"/api/report/{file_id}")
-            self.assertEqual(report_resp.status_code, 200)
-            report = json.loads(report_resp.data)
-            self.assertTrue(report["success"])
-            self.assertIn("summary", report)
-            self.assertIn("requirements", report)
-
-        except ImportError:
-            self.skipTest("python-docx not installed")
-
-
-class TestAnalysesListEndpoint(unittest.TestCase):
-
-    def setUp(self):
-        self.app = create_app()
-        self.app.config["TESTING"] = True
-        self.client = self.app.test_client()
+        # 1. Upload
+        upload_resp = self.client.post(
+            "/api/upload",
+            data={"file": (io.BytesIO(self.UPLOAD_DOCX), "e2e_test.docx")},
+            content_type="multipart/form-data",
+        )
+        assert upload_resp.status_code == 200, upload_resp.data
+        file_id = upload_resp.get_json()["file_id"]
+
+        # 2. Analyze
+        analyze_resp = self.client.post(
+            "/api/analyze",
+            json={"file_id": file_id},
+        )
+        assert analyze_resp.status_code == 200, analyze_resp.data
+        analysis = analyze_resp.get_json()
+        assert analysis["success"]
+        assert analysis["total_requirements"] > 0
+        assert "domain" in analysis
+        assert "category_scores" in analysis
+        assert "recommendations" in analysis
+
+        # 3. Fetch report
+        report_resp = self.client.get(f"/api/report/{file_id}")
+        assert report_resp.status_code == 200
+        report = report_resp.get_json()
+        assert report["success"]
+        assert "summary" in report
+        assert "requirements" in report
+
+
+@pytest.mark.usefixtures("client_class")
+class TestAnalysesListEndpoint:
 
     def test_analyses_returns_200(self):
         resp = self.client.get("/api/analyses")
-        self.assertEqual(resp.status_code, 200)
-        data = json.loads(resp.data)
-        self.assertTrue(data["success"])
-        self.assertIn("analyses", data)
-        self.assertIsInstance(data["analyses"], list)
+        assert resp.status_code == 200
+        data = resp.get_json()
+        assert data["success"]
+        assert "analyses" in data
+        assert isinstance(data["analyses"], list)
 
 
 if __name__ == "__main__":
-    unittest.main(verbosity=2)
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -11,66 +11,103 @@ Run from backend/ directory:
 
 import os
 import sys
-import unittest
+
+import pytest
 
 # Ensure backend/ is on the path when running directly
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if __name__ == "__main__":  # standalone run; under pytest backend/ is already on sys.path
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from services.classifier import classifier
 
 
-class TestRequirementClassifier(unittest.TestCase):
+class TestRequirementClassifier:
+
+    # Spot-check texts, classified with one classify_batch() call in setup_class
+    PROBES = {
+        "aes":      "The system shall encrypt all passwords using AES-256.",
+        "perf":     "The system must respond within 2 seconds under load.",
+        "reset":    "Users shall be able to reset their password via email.",
+    }
+
+    # Hand-labelled corpus for the aggregate accuracy spot-check
+    LABELED = [
+        ("The system shall use TLS 1.3 for all data in transit.", "Security"),
+        ("The system must process requests within 500 milliseconds under normal load.", "Efficiency"),
+        ("All passwords must be stored using bcrypt hashing with a salt.", "Security"),
+        ("The system shall provide role-based access control for administrators.", "Security"),
+        ("The system must respond to all API requests within 3 seconds.", "Efficiency"),
+        ("The application shall support a minimum of 500 concurrent sessions.", "Efficiency"),
+        ("The application shall be deployable on Linux and Windows platforms.", "Portability"),
+        ("The database must be backed up automatically every 24 hours.", "Reliability"),
+        ("The system shall be available 99.9% of the time.", "Reliability"),
+        ("The interface shall be easy to learn for new users.", "Usability"),
+        ("The code shall follow a modular architecture to ease maintenance.", "Maintainability"),
+        ("Users shall be able to upload documents up to 10 MB in size.", "Functionality"),
+    ]
+
+    @classmethod
+    def setup_class(cls):
+        # Probes and labelled corpus share one classify_batch() call
+        texts = list(cls.PROBES.values()) + [text for text, _ in cls.LABELED]
+        batch = classifier.classify_batch(texts)
+        cls.results = dict(zip(cls.PROBES, batch))
+        cls.labeled_results = batch[len(cls.PROBES):]
 
     # ── Model loading ─────────────────────────────────────────────────── #
 
     def test_model_loaded(self):
         """Classifier and vectorizer must be loaded at import time."""
-        self.assertIsNotNone(classifier.model)
-        self.assertIsNotNone(classifier.vectorizer)
+        assert classifier.model is not None
+        assert classifier.vectorizer is not None
 
     def test_classes_populated(self):
         """Model must expose all 7 ISO 9126 categories."""
         expected = {"Functionality", "Security", "Reliability",
                     "Efficiency", "Usability", "Maintainability", "Portability"}
-        self.assertEqual(set(classifier.classes), expected)
+        assert set(classifier.classes) == expected
 
     def test_model_info_has_accuracy(self):
         info = classifier.get_model_info()
-        self.assertIn("accuracy", info)
-        self.assertGreater(info["accuracy"], 0.7)   # Must be above 70 %
+        assert "accuracy" in info
+        assert info["accuracy"] > 0.7   # Must be above 70 %
 
     # ── Single classification ─────────────────────────────────────────── #
 
     def test_classify_returns_required_keys(self):
-        result = classifier.classify("The system shall encrypt all passwords using AES-256.")
-        self.assertIn("text",          result)
-        self.assertIn("category",      result)
-        self.assertIn("confidence",    result)
-        self.assertIn("probabilities", result)
+        result = self.results["aes"]
+        assert "text" in result
+        assert "category" in result
+        assert "confidence" in result
+        assert "probabilities" in result
+
+    def test_classify_matches_batch(self):
+        """classify() on one text must agree with its classify_batch() entry."""
+        result = classifier.classify(self.PROBES["aes"])
+        expected = dict(self.results["aes"])
+        del expected["index"]
+        assert result == expected
 
     def test_classify_category_is_known(self):
-        result = classifier.classify("The system shall encrypt all passwords using AES-256.")
-        self.assertIn(result["category"], classifier.classes)
+        assert self.results["aes"]["category"] in classifier.classes
 
     def test_classify_confidence_range(self):
-        result = classifier.classify("The system must respond within 2 seconds under load.")
-        self.assertGreaterEqual(result["confidence"], 0.0)
-        self.assertLessEqual(result["confidence"], 100.0)
+        for key, result in self.results.items():
+            assert 0.0 <= result["confidence"] <= 100.0, key
 
     def test_classify_probabilities_sum_to_100(self):
-        result = classifier.classify("Users shall be able to reset their password via email.")
-        total = sum(result["probabilities"].values())
-        self.assertAlmostEqual(total, 100.0, places=1)
+        total = sum(self.results["reset"]["probabilities"].values())
+        assert total == pytest.approx(100.0, abs=0.05)
 
     def test_classify_empty_text(self):
         """Empty text should return category=Unknown and confidence=0."""
         result = classifier.classify("")
-        self.assertEqual(result["category"],   "Unknown")
-        self.assertEqual(result["confidence"], 0.0)
+        assert result["category"] == "Unknown"
+        assert result["confidence"] == 0.0
 
     def test_classify_whitespace_only(self):
         result = classifier.classify("   ")
-        self.assertEqual(result["category"],   "Unknown")
+        assert result["category"] == "Unknown"
 
     # ── Batch classification ─────────────────────────────────────────── #
 
@@ -81,14 +118,14 @@ class TestRequirementClassifier(unittest.TestCase):
             "Users should be able to upload files up to 100 MB.",
         ]
         results = classifier.classify_batch(texts)
-        self.assertIsInstance(results, list)
-        self.assertEqual(len(results), 3)
+        assert isinstance(results, list)
+        assert len(results) == 3
 
     def test_classify_batch_each_has_index(self):
         texts = ["The system shall authenticate users.", "The app must load in 3 seconds."]
         results = classifier.classify_batch(texts)
         for i, r in enumerate(results):
-            self.assertEqual(r["index"], i)
+            assert r["index"] == i
 
     def test_classify_batch_all_categories_valid(self):
         texts = [
@@ -98,25 +135,18 @@ class TestRequirementClassifier(unittest.TestCase):
         ]
         results = classifier.classify_batch(texts)
         for r in results:
-            self.assertIn(r["category"], classifier.classes)
+            assert r["category"] in classifier.classes
 
     # ── Known category spot-checks ────────────────────────────────────── #
 
-    def test_security_requirement(self):
-        result = classifier.classify(
-            "The system shall use TLS 1.3 for all data in transit."
-        )
-        # Confidence-weighted: if confidence > 60 it must be Security
-        if result["confidence"] > 60:
-            self.assertEqual(result["category"], "Security")
-
-    def test_efficiency_requirement(self):
-        result = classifier.classify(
-            "The system must process requests within 500 milliseconds under normal load."
+    def test_labeled_spot_check_accuracy(self):
+        """At least 80 % of the labelled corpus must land in its expected category."""
+        hits = sum(
+            result["category"] == label
+            for result, (_, label) in zip(self.labeled_results, self.LABELED)
         )
-        if result["confidence"] > 60:
-            self.assertEqual(result["category"], "Efficiency")
+        assert hits / len(self.LABELED) >= 0.8
 
 
 if __name__ == "__main__":
-    unittest.main(verbosity=2)
+    sys.exit(pytest.main([__file__, "-v"]))
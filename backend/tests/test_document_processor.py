@@ -9,111 +9,183 @@ Run from backend/ directory:
     python tests/test_document_processor.py
 """
 
+import io
 import os
 import sys
-import unittest
+import tempfile
+import zipfile
+from unittest import mock
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import pytest
 
+if __name__ == "__main__":  # standalone run; under pytest backend/ is already on sys.path
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services import document_processor
 from services.document_processor import (
     clean_extracted_text,
     process_document,
 )
 
+try:
+    from docx import Document as DocxDocument
+    HAS_DOCX = True
+except ImportError:
+    HAS_DOCX = False
+
+
+def _write_temp(suffix: str, data: bytes) -> str:
+    """Write *data* to a fresh temp file and return its path."""
+    fd, path = tempfile.mkstemp(suffix=suffix)
+    with os.fdopen(fd, "wb") as f:
+        f.write(data)
+    return path
+
 
-class TestCleanExtractedText(unittest.TestCase):
+class TestCleanExtractedText:
     """Tests for the text cleaning function — no file I/O needed."""
 
     def test_strips_leading_trailing_whitespace(self):
         result = clean_extracted_text("  hello world  ")
-        self.assertEqual(result, "hello world")
+        assert result == "hello world"
 
     def test_collapses_internal_whitespace(self):
         result = clean_extracted_text("hello   world\there")
-        self.assertNotIn("   ", result)
-        self.assertNotIn("\t", result)
+        assert "   " not in result
+        assert "\t" not in result
 
     def test_removes_form_feed(self):
         result = clean_extracted_text("page1\fpage2")
-        self.assertNotIn("\f", result)
+        assert "\f" not in result
 
     def test_collapses_excessive_blank_lines(self):
         text = "line1\n\n\n\n\nline2"
         result = clean_extracted_text(text)
-        self.assertNotIn("\n\n\n", result)
+        assert "\n\n\n" not in result
 
     def test_empty_string(self):
-        self.assertEqual(clean_extracted_text(""), "")
+        assert clean_extracted_text("") == ""
 
     def test_none_like_empty(self):
-        self.assertEqual(clean_extracted_text(""), "")
+        assert clean_extracted_text("") == ""
 
     def test_only_special_chars_removed(self):
         """Lines that are purely special chars should be dropped."""
         text = "header\n--------------------\nbody text here"
         result = clean_extracted_text(text)
-        self.assertNotIn("----", result)
+        assert "----" not in result
 
     def test_preserves_requirement_sentences(self):
         text = "The system shall encrypt all passwords. The app must respond in 2 seconds."
         result = clean_extracted_text(text)
-        self.assertIn("shall encrypt", result)
-        self.assertIn("must respond", result)
+        assert "shall encrypt" in result
+        assert "must respond" in result
 
 
-class TestProcessDocument(unittest.TestCase):
+class TestProcessDocument:
     """Tests for process_document() — tests against non-existent files
     to verify error handling without needing actual PDFs."""
 
+    @classmethod
+    def setup_class(cls):
+        # Input files are written once per class and only read by the tests
+        cls._txt_path = _write_temp(".txt", b"some text")
+        cls._docx_path = None
+        if HAS_DOCX:
+            doc = DocxDocument()
+            doc.add_paragraph("The system shall authenticate all users before granting access.")
+            doc.add_paragraph("All data must be encrypted at rest using AES-256.")
+            buf = io.BytesIO()
+            doc.save(buf)
+            cls._docx_path = _write_temp(".docx", buf.getvalue())
+
+    @classmethod
+    def teardown_class(cls):
+        for path in (cls._txt_path, cls._docx_path):
+            if path:
+                os.unlink(path)
+
     def test_missing_file_returns_failure(self):
         result = process_document("/nonexistent/path/file.pdf")
-        self.assertFalse(result["success"])
-        self.assertIsNotNone(result["error"])
-        self.assertEqual(result["text"], "")
+        assert not result["success"]
+        assert result["error"] is not None
+        assert result["text"] == ""
 
     def test_unsupported_extension_returns_failure(self):
-        # Create a temp txt file to avoid "not found" error
-        import tempfile
-        with tempfile.NamedTemporaryFile(suffix=".txt", delete=False) as f:
-            f.write(b"some text")
-            tmp_path = f.name
-        try:
-            result = process_document(tmp_path)
-            self.assertFalse(result["success"])
-            self.assertIn("Unsupported", result["error"])
-        finally:
-            os.unlink(tmp_path)
+        # A real .txt file, so the failure is the extension and not "not found"
+        result = process_document(self._txt_path)
+        assert not result["success"]
+        assert "Unsupported" in result["error"]
 
     def test_result_keys_always_present(self):
         """Even on failure, all keys must be present in the result."""
         result = process_document("/no/such/file.pdf")
         for key in ("text", "page_count", "word_count", "file_type", "success", "error"):
-            self.assertIn(key, result)
+            assert key in result
 
+    @pytest.mark.skipif(not HAS_DOCX, reason="python-docx not installed")
     def test_process_docx_from_scratch(self):
-        """Create a minimal DOCX in memory and verify extraction."""
-        try:
-            from docx import Document as DocxDocument
-            import tempfile
-
-            doc = DocxDocument()
-            doc.add_paragraph("The system shall authenticate all users before granting access.")
-            doc.add_paragraph("All data must be encrypted at rest using AES-256.")
-
-            with tempfile.NamedTemporaryFile(suffix=".docx", delete=False) as f:
-                doc.save(f.name)
-                tmp_path = f.name
-
-            result = process_document(tmp_path)
-            self.assertTrue(result["success"], msg=result.get("error"))
-            self.assertIn("authenticate", result["text"])
-            self.assertGreater(result["word_count"], 5)
-        except ImportError:
-            self.skipTest("python-docx not installed")
-        finally:
-            if "tmp_path" in dir():
-                os.unlink(tmp_path)
+        """Extract text from the class's minimal DOCX."""
+        result = process_document(self._docx_path)
+        assert result["success"], result.get("error")
+        assert "authenticate" in result["text"]
+        assert result["word_count"] > 5
+
+    @pytest.mark.skipif(not HAS_DOCX, reason="python-docx not installed")
+    def test_unchanged_content_is_parsed_once(self, tmp_path):
+        """A second file with identical bytes is served from the extraction cache."""
+        copy_path = tmp_path / "copy.docx"
+        with open(self._docx_path, "rb") as f:
+            copy_path.write_bytes(f.read())
+        document_processor._EXTRACT_CACHE.clear()
+
+        with mock.patch.object(
+            document_processor, "extract_text_from_docx",
+            wraps=document_processor.extract_text_from_docx,
+        ) as extract:
+            first = process_document(self._docx_path)
+            second = process_document(str(copy_path))
+
+        assert extract.call_count == 1
+        assert first == second
+
+    @pytest.mark.skipif(not HAS_DOCX, reason="python-docx not installed")
+    def test_docx_tables_and_sections_extracted(self, tmp_path):
+        """Table cells (merged ones included) and section count come through."""
+        doc = DocxDocument()
+        doc.add_paragraph("The system shall export reports as CSV.")
+        table = doc.add_table(rows=2, cols=2)
+        table.cell(0, 0).text = "Uptime must be 99.9%"
+        table.cell(1, 1).text = "Logs must be kept 90 days"
+        table.cell(0, 0).merge(table.cell(0, 1))
+        doc.add_section()
+        buf = io.BytesIO()
+        doc.save(buf)
+        path = tmp_path / "tables.docx"
+        path.write_bytes(buf.getvalue())
+
+        text, section_count = document_processor.extract_text_from_docx(str(path))
+
+        assert text.splitlines() == [
+            "The system shall export reports as CSV.",
+            "Uptime must be 99.9%",
+            "Uptime must be 99.9%",
+            "Logs must be kept 90 days",
+        ]
+        assert section_count == 2
+
+    def test_non_word_zip_returns_failure(self, tmp_path):
+        buf = io.BytesIO()
+        with zipfile.ZipFile(buf, "w") as zf:
+            zf.writestr("_rels/.rels", "<Relationships xmlns="
+                        "'http://schemas.openxmlformats.org/package/2006/relationships'/>")
+        path = tmp_path / "not_word.docx"
+        path.write_bytes(buf.getvalue())
+
+        result = process_document(str(path))
+        assert not result["success"]
+        assert result["error"]
 
 
 if __name__ == "__main__":
-    unittest.main(verbosity=2)
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -7,26 +7,31 @@ Tests for the Quality Plan analyzer service and API routes.
 import io
 import os
 import sys
-import unittest
+from unittest import mock
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import pytest
 
+if __name__ == "__main__":  # standalone run; under pytest backend/ is already on sys.path
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services import quality_plan_analyzer
 from services.quality_plan_analyzer import (
     analyze_quality_plan,
     _find_evidence,
     CATEGORY_EVIDENCE_KEYWORDS,
     ALL_CATEGORIES,
 )
+from tests.docx_fixtures import make_docx
 
 
 # ──────────────────────────────────────────────────────────────────────────── #
 # Unit tests for the analyzer service                                          #
 # ──────────────────────────────────────────────────────────────────────────── #
 
-class TestQualityPlanAnalyzer(unittest.TestCase):
+class TestQualityPlanAnalyzer:
     """Test the core analyze_quality_plan() function."""
 
-    def setUp(self):
+    def setup_method(self):
         """Set up common SRS data to compare against."""
         self.srs_category_scores = {
             "Functionality":   {"count": 5, "percentage": 35},
@@ -79,15 +84,14 @@ class TestQualityPlanAnalyzer(unittest.TestCase):
             self.srs_present, self.srs_missing
         )
 
-        self.assertGreater(result["overall_coverage"], 80)
-        self.assertGreater(result["achievable_quality"], 70)
-        self.assertEqual(result["plan_strength"], "Strong")
-        # All 7 categories should be covered
-        for cat in ALL_CATEGORIES:
-            self.assertTrue(
-                result["category_coverage"][cat]["covered"],
-                f"{cat} should be covered"
-            )
+        assert result["overall_coverage"] > 80
+        assert result["achievable_quality"] > 70
+        assert result["plan_strength"] == "Strong"
+        # All 7 categories should be covered; a failure lists the missing ones
+        covered = {
+            cat for cat in ALL_CATEGORIES if result["category_coverage"][cat]["covered"]
+        }
+        assert covered == set(ALL_CATEGORIES)
 
     def test_partial_coverage_plan(self):
         """A plan covering some categories should get moderate scores."""
@@ -105,10 +109,10 @@ class TestQualityPlanAnalyzer(unittest.TestCase):
             self.srs_present, self.srs_missing
         )
 
-        self.assertTrue(result["category_coverage"]["Functionality"]["covered"])
-        self.assertTrue(result["category_coverage"]["Security"]["covered"])
-        self.assertFalse(result["category_coverage"]["Portability"]["covered"])
-        self.assertLess(result["overall_coverage"], 100)
+        assert result["category_coverage"]["Functionality"]["covered"]
+        assert result["category_coverage"]["Security"]["covered"]
+        assert not result["category_coverage"]["Portability"]["covered"]
+        assert result["overall_coverage"] < 100
 
     def test_empty_plan(self):
         """An empty plan should return zero coverage."""
@@ -117,9 +121,9 @@ class TestQualityPlanAnalyzer(unittest.TestCase):
             self.srs_present, self.srs_missing
         )
 
-        self.assertEqual(result["overall_coverage"], 0)
-        self.assertEqual(result["achievable_quality"], 0)
-        self.assertEqual(result["plan_strength"], "Weak")
+        assert result["overall_coverage"] == 0
+        assert result["achievable_quality"] == 0
+        assert result["plan_strength"] == "Weak"
 
     def test_no_coverage_plan(self):
         """A plan with zero relevant keywords should score poorly."""
@@ -135,8 +139,8 @@ class TestQualityPlanAnalyzer(unittest.TestCase):
             self.srs_present, self.srs_missing
         )
 
-        self.assertLessEqual(result["overall_coverage"], 20)
-        self.assertEqual(result["plan_strength"], "Weak")
+        assert result["overall_coverage"] <= 20
+        assert result["plan_strength"] == "Weak"
 
     def test_suggestions_for_uncovered_categories(self):
         """Suggestions should appear for SRS categories not in the plan."""
@@ -149,7 +153,7 @@ class TestQualityPlanAnalyzer(unittest.TestCase):
 
         suggestion_cats = [s["category"] for s in result["suggestions"]]
         # Security is in SRS but not in this simple plan
-        self.assertIn("Security", suggestion_cats)
+        assert "Security" in suggestion_cats
 
     def test_proactive_coverage_suggestion(self):
         """Plan covering categories NOT in SRS should get 'proactive' suggestion."""
@@ -165,10 +169,8 @@ class TestQualityPlanAnalyzer(unittest.TestCase):
 
         proactive = [s for s in result["suggestions"] if s.get("type") == "proactive"]
         # Portability is NOT in SRS but IS in the plan
-        self.assertTrue(
-            any(s["category"] == "Portability" for s in proactive),
+        assert any(s["category"] == "Portability" for s in proactive), \
             "Should detect proactive coverage of Portability"
-        )
 
     def test_summary_is_human_readable(self):
         """Summary should be a non-empty readable string."""
@@ -179,8 +181,8 @@ class TestQualityPlanAnalyzer(unittest.TestCase):
             self.srs_present, self.srs_missing
         )
 
-        self.assertIsInstance(result["summary"], str)
-        self.assertGreater(len(result["summary"]), 50)
+        assert isinstance(result["summary"], str)
+        assert len(result["summary"]) > 50
 
     def test_achievable_quality_has_proactive_bonus(self):
         """Covering categories missing from SRS should boost achievable quality."""
@@ -200,168 +202,178 @@ class TestQualityPlanAnalyzer(unittest.TestCase):
             self.srs_present, self.srs_missing
         )
 
-        self.assertGreaterEqual(r2["achievable_quality"], r1["achievable_quality"])
+        assert r2["achievable_quality"] >= r1["achievable_quality"]
 
+    def test_repeated_plan_is_scanned_once(self):
+        """Re-analysing the same plan text reuses the cached evidence scan."""
+        plan_text = "Functional testing and unit tests. Penetration testing every release."
+        quality_plan_analyzer._EVIDENCE_CACHE.clear()
 
-class TestEvidenceFinding(unittest.TestCase):
+        with mock.patch.object(
+            quality_plan_analyzer, "_scan_all", wraps=quality_plan_analyzer._scan_all,
+        ) as scan:
+            r1 = analyze_quality_plan(
+                plan_text, self.srs_category_scores, self.srs_present, self.srs_missing
+            )
+            r1["category_coverage"]["Security"]["evidence_snippets"].clear()
+            r2 = analyze_quality_plan(
+                plan_text, self.srs_category_scores, self.srs_present, self.srs_missing
+            )
+
+        assert scan.call_count == 1
+        assert r2["category_coverage"]["Security"]["evidence_snippets"]
+
+
+class TestEvidenceFinding:
     """Test the _find_evidence helper."""
 
     def test_finds_keywords(self):
         text = "We will conduct penetration testing and vulnerability scanning."
         keywords = ["penetration test", "vulnerability"]
-        evidence = _find_evidence(text.lower(), text, keywords)
-        self.assertGreater(len(evidence), 0)
+        evidence = _find_evidence(text, keywords)
+        assert len(evidence) > 0
 
     def test_no_false_positives(self):
         text = "The weather today is sunny and warm."
         keywords = ["penetration test", "vulnerability"]
-        evidence = _find_evidence(text.lower(), text, keywords)
-        self.assertEqual(len(evidence), 0)
+        evidence = _find_evidence(text, keywords)
+        assert len(evidence) == 0
+
+    def test_keywords_outside_shared_vocabulary(self):
+        text = "Chaos drills run monthly against the staging cluster environment."
+        evidence = _find_evidence(text, ["Chaos Drills"])
+        assert len(evidence) == 1
+        assert "Chaos drills" in evidence[0]
 
 
 # ──────────────────────────────────────────────────────────────────────────── #
 # API route tests                                                               #
 # ──────────────────────────────────────────────────────────────────────────── #
 
-def _make_docx(paragraphs):
-    """Create a minimal DOCX in memory."""
-    from docx import Document as DocxDocument
-    doc = DocxDocument()
-    for p in paragraphs:
-        doc.add_paragraph(p)
-    buf = io.BytesIO()
-    doc.save(buf)
-    buf.seek(0)
-    return buf
-
-
-class TestQualityPlanAPI(unittest.TestCase):
-    """Test the /api/quality-plan/<analysis_id> endpoints."""
-
-    @classmethod
-    def setUpClass(cls):
-        from app import create_app
-        cls.app = create_app()
-        cls.app.config["TESTING"] = True
-        cls.client = cls.app.test_client()
-
-        # First: upload and analyze an SRS file to get an analysis_id
-        srs_paragraphs = [
-            "Software Requirements Specification",
-            "The system shall authenticate users through a secure login mechanism.",
-            "The system must encrypt all sensitive data at rest and in transit.",
-            "The system should respond to user requests within 2 seconds.",
-            "The system shall maintain 99.9% uptime availability.",
-            "The system must provide clear error messages to users.",
-            "The system should support both PDF and DOCX file uploads.",
-            "The system shall log all user actions for audit purposes.",
-            "The system must validate all input data before processing.",
-        ]
-
-        # Upload SRS
-        buf = _make_docx(srs_paragraphs)
-        resp = cls.client.post(
-            "/api/upload",
-            data={"file": (buf, "test_srs.docx")},
-            content_type="multipart/form-data",
-        )
-        assert resp.status_code == 200, f"Upload failed: {resp.get_json()}"
-        cls.file_id = resp.get_json()["file_id"]
+SRS_PARAGRAPHS = (
+    "Software Requirements Specification",
+    "The system shall authenticate users through a secure login mechanism.",
+    "The system must encrypt all sensitive data at rest and in transit.",
+    "The system should respond to user requests within 2 seconds.",
+    "The system shall maintain 99.9% uptime availability.",
+    "The system must provide clear error messages to users.",
+    "The system should support both PDF and DOCX file uploads.",
+    "The system shall log all user actions for audit purposes.",
+    "The system must validate all input data before processing.",
+)
+
+# One plan document shared by the upload and read-back tests
+PLAN_PARAGRAPHS = (
+    "Quality Assurance Plan",
+    "1. Functional Testing",
+    "Unit tests and integration tests will verify all functional requirements.",
+    "Test cases will cover all acceptance criteria.",
+    "2. Security Measures",
+    "We will perform penetration testing and vulnerability assessment.",
+    "Authentication and access control mechanisms will be verified.",
+    "3. Performance Testing",
+    "Load testing will verify response time requirements.",
+    "Throughput benchmarks will be established.",
+    "4. Usability Review",
+    "User acceptance testing with real users.",
+    "Accessibility compliance with WCAG guidelines.",
+)
+
+
+@pytest.fixture(scope="session")
+def srs_analysis_id(client):
+    """Upload and analyze the SRS once; every plan test attaches to it."""
+    resp = client.post(
+        "/api/upload",
+        data={"file": (make_docx(SRS_PARAGRAPHS), "test_srs.docx")},
+        content_type="multipart/form-data",
+    )
+    assert resp.status_code == 200, f"Upload failed: {resp.get_json()}"
+    file_id = resp.get_json()["file_id"]
+
+    resp = client.post("/api/analyze", json={"file_id": file_id})
+    assert resp.status_code == 200, f"Analyze failed: {resp.get_json()}"
+    return file_id
+
+
+@pytest.fixture(scope="class")
+def srs_analysis(request, srs_analysis_id):
+    """Expose the shared SRS analysis as ``self.analysis_id``."""
+    request.cls.analysis_id = srs_analysis_id
+
+
+@pytest.mark.usefixtures("client_class", "srs_analysis")
+class TestQualityPlanAPI:
+    """
+    Test the /api/quality-plan/<analysis_id> endpoints.
 
-        # Analyze SRS
-        resp = cls.client.post("/api/analyze", json={"file_id": cls.file_id})
-        assert resp.status_code == 200, f"Analyze failed: {resp.get_json()}"
-        cls.analysis_id = cls.file_id
+    Tests are order-independent (each one that reads a plan uploads it
+    first), so xdist may spread them across workers with --dist=load.
+    """
 
-    def test_01_get_quality_plan_before_upload(self):
+    def test_get_quality_plan_before_upload(self):
         """GET should return 404 if no plan uploaded yet."""
         # Use a fresh analysis_id that won't have a plan
         resp = self.client.get(f"/api/quality-plan/{self.analysis_id}_noplan")
         data = resp.get_json()
-        self.assertEqual(resp.status_code, 404)
-        self.assertFalse(data["has_plan"])
+        assert resp.status_code == 404
+        assert not data["has_plan"]
 
-    def test_02_upload_quality_plan_no_file(self):
+    def test_upload_quality_plan_no_file(self):
         """POST without file should return 400."""
         resp = self.client.post(f"/api/quality-plan/{self.analysis_id}")
-        self.assertEqual(resp.status_code, 400)
+        assert resp.status_code == 400
 
-    def test_03_upload_quality_plan_bad_analysis_id(self):
+    def test_upload_quality_plan_bad_analysis_id(self):
         """POST to non-existent analysis should return 404."""
-        buf = _make_docx(["dummy content"])
+        buf = make_docx(["dummy content"])
         resp = self.client.post(
             "/api/quality-plan/nonexistent_id_12345",
             data={"file": (buf, "plan.docx")},
             content_type="multipart/form-data",
         )
-        self.assertEqual(resp.status_code, 404)
+        assert resp.status_code == 404
 
-    def test_04_upload_and_analyze_quality_plan(self):
+    def test_upload_and_analyze_quality_plan(self):
         """Full quality plan upload + analysis workflow."""
-        plan_paragraphs = [
-            "Quality Assurance Plan",
-            "1. Functional Testing",
-            "Unit tests and integration tests will verify all functional requirements.",
-            "Test cases will cover all acceptance criteria.",
-            "2. Security Measures",
-            "We will perform penetration testing and vulnerability assessment.",
-            "Authentication and access control mechanisms will be verified.",
-            "3. Performance Testing",
-            "Load testing will verify response time requirements.",
-            "Throughput benchmarks will be established.",
-            "4. Usability Review",
-            "User acceptance testing with real users.",
-            "Accessibility compliance with WCAG guidelines.",
-        ]
-
-        buf = _make_docx(plan_paragraphs)
         resp = self.client.post(
             f"/api/quality-plan/{self.analysis_id}",
-            data={"file": (buf, "quality_plan.docx")},
+            data={"file": (make_docx(PLAN_PARAGRAPHS), "quality_plan.docx")},
             content_type="multipart/form-data",
         )
 
-        self.assertEqual(resp.status_code, 200)
+        assert resp.status_code == 200
         result = resp.get_json()
-        self.assertTrue(result["success"])
-        self.assertIn("overall_coverage", result)
-        self.assertIn("achievable_quality", result)
-        self.assertIn("plan_strength", result)
-        self.assertIn("category_coverage", result)
-        self.assertIn("suggestions", result)
-        self.assertIn("summary", result)
+        assert result["success"]
+        for key in ("overall_coverage", "achievable_quality", "plan_strength",
+                    "category_coverage", "suggestions", "summary"):
+            assert key in result
 
         # Coverage should be > 0 since the plan covers several categories
-        self.assertGreater(result["overall_coverage"], 0)
-        self.assertGreater(result["achievable_quality"], 0)
+        assert result["overall_coverage"] > 0
+        assert result["achievable_quality"] > 0
 
         # Functionality and Security should be covered
-        self.assertTrue(result["category_coverage"]["Functionality"]["covered"])
-        self.assertTrue(result["category_coverage"]["Security"]["covered"])
+        assert result["category_coverage"]["Functionality"]["covered"]
+        assert result["category_coverage"]["Security"]["covered"]
 
-    def test_05_get_quality_plan_after_upload(self):
+    def test_get_quality_plan_after_upload(self):
         """GET should return the plan after it's been uploaded."""
         # First ensure a plan exists by uploading one
-        plan_paragraphs = [
-            "Simple QA Plan",
-            "Unit tests and functional testing will be done.",
-            "Penetration testing for security.",
-        ]
-        buf = _make_docx(plan_paragraphs)
         self.client.post(
             f"/api/quality-plan/{self.analysis_id}",
-            data={"file": (buf, "qp.docx")},
+            data={"file": (make_docx(PLAN_PARAGRAPHS), "qp.docx")},
             content_type="multipart/form-data",
         )
 
         resp = self.client.get(f"/api/quality-plan/{self.analysis_id}")
         data = resp.get_json()
-        self.assertEqual(resp.status_code, 200)
-        self.assertTrue(data["has_plan"])
-        self.assertIn("overall_coverage", data)
-        self.assertIn("category_coverage", data)
+        assert resp.status_code == 200
+        assert data["has_plan"]
+        assert "overall_coverage" in data
+        assert "category_coverage" in data
 
-    def test_06_upload_invalid_file_type(self):
+    def test_upload_invalid_file_type(self):
         """Uploading a .txt file should be rejected."""
         data = {"file": (io.BytesIO(b"just plain text"), "plan.txt")}
         resp = self.client.post(
@@ -369,8 +381,8 @@ class TestQualityPlanAPI(unittest.TestCase):
             data=data,
             content_type="multipart/form-data",
         )
-        self.assertEqual(resp.status_code, 400)
+        assert resp.status_code == 400
 
 
 if __name__ == "__main__":
-    unittest.main()
+    sys.exit(pytest.main([__file__, "-v"]))
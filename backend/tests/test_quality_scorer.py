@@ -9,9 +9,12 @@ Run from backend/ directory:
 
 import os
 import sys
-import unittest
+from unittest import mock
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import pytest
+
+if __name__ == "__main__":  # standalone run; under pytest backend/ is already on sys.path
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from services.quality_scorer import (
     ALL_CATEGORIES,
@@ -32,98 +35,117 @@ def _make_classified(categories: list[str]) -> list[dict]:
     ]
 
 
-class TestCategoryScores(unittest.TestCase):
+class TestCategoryScores:
 
     def test_empty_input(self):
         scores = calculate_category_scores([])
         for cat in ALL_CATEGORIES:
-            self.assertEqual(scores[cat]["count"], 0)
-            self.assertFalse(scores[cat]["meets_minimum"])
+            assert scores[cat]["count"] == 0
+            assert not scores[cat]["meets_minimum"]
 
     def test_single_category(self):
         reqs = _make_classified(["Security"] * 5)
         scores = calculate_category_scores(reqs)
-        self.assertEqual(scores["Security"]["count"], 5)
-        self.assertEqual(scores["Security"]["percentage"], 100.0)
-        self.assertEqual(scores["Functionality"]["count"], 0)
+        assert scores["Security"]["count"] == 5
+        assert scores["Security"]["percentage"] == 100.0
+        assert scores["Functionality"]["count"] == 0
 
     def test_all_categories_present(self):
         reqs = _make_classified(ALL_CATEGORIES)
         scores = calculate_category_scores(reqs)
         for cat in ALL_CATEGORIES:
-            self.assertEqual(scores[cat]["count"], 1)
+            assert scores[cat]["count"] == 1
 
     def test_weight_values_sum_to_1(self):
         total = sum(CATEGORY_WEIGHTS.values())
-        self.assertAlmostEqual(total, 1.0, places=5)
+        assert total == pytest.approx(1.0)
 
     def test_meets_minimum_flag(self):
         reqs = _make_classified(["Functionality"] * 5 + ["Security"] * 1)
         scores = calculate_category_scores(reqs)
-        self.assertTrue(scores["Functionality"]["meets_minimum"])
-        self.assertFalse(scores["Security"]["meets_minimum"])  # needs 3
-
+        assert scores["Functionality"]["meets_minimum"]
+        assert not scores["Security"]["meets_minimum"]  # needs 3
 
-class TestDomainDetection(unittest.TestCase):
 
-    def test_banking_domain(self):
-        reqs = [
-            {"text": "The system shall process bank transactions securely.", "category": "Security", "confidence": 90},
-            {"text": "Credit must be updated after each payment.", "category": "Functionality", "confidence": 85},
-        ]
-        result = detect_domain(reqs)
-        self.assertEqual(result["domain"], "Banking / Finance")
-        self.assertGreater(result["confidence"], 0)
-        self.assertIn("Security", result["critical_categories"])
+def _reqs(*texts_and_categories):
+    """Classified requirements from (text, category) pairs."""
+    return [
+        {"text": text, "category": cat, "confidence": 85}
+        for text, cat in texts_and_categories
+    ]
 
-    def test_healthcare_domain(self):
-        reqs = [
-            {"text": "The system shall store patient medical records.", "category": "Functionality", "confidence": 90},
-            {"text": "Clinical diagnosis data must be encrypted.", "category": "Security", "confidence": 85},
-        ]
-        result = detect_domain(reqs)
-        self.assertEqual(result["domain"], "Healthcare")
 
-    def test_library_management_domain(self):
-        reqs = [
-            {"text": "The system shall allow members to borrow books.", "category": "Functionality", "confidence": 90},
-            {"text": "Patron can search catalog by ISBN or title.", "category": "Usability", "confidence": 85},
-            {"text": "Overdue items shall generate fine notifications.", "category": "Functionality", "confidence": 88},
-        ]
+# (requirements, expected domain, categories that must be flagged critical)
+DOMAIN_CASES = [
+    pytest.param(
+        _reqs(("The system shall process bank transactions securely.", "Security"),
+              ("Credit must be updated after each payment.", "Functionality")),
+        "Banking / Finance", {"Security"}, id="banking",
+    ),
+    pytest.param(
+        _reqs(("The system shall store patient medical records.", "Functionality"),
+              ("Clinical diagnosis data must be encrypted.", "Security")),
+        "Healthcare", set(), id="healthcare",
+    ),
+    pytest.param(
+        _reqs(("The system shall allow members to borrow books.", "Functionality"),
+              ("Patron can search catalog by ISBN or title.", "Usability"),
+              ("Overdue items shall generate fine notifications.", "Functionality")),
+        "Library Management", {"Usability"}, id="library",
+    ),
+    pytest.param(
+        _reqs(("Process financial transaction.", "Functionality"),
+              ("Secure bank transfer access.", "Security")),
+        "Banking / Finance", {"Security", "Reliability"}, id="critical-categories",
+    ),
+]
+
+
+class TestDomainDetection:
+
+    @pytest.mark.parametrize("reqs,expected_domain,expected_critical", DOMAIN_CASES)
+    def test_keyword_domain(self, reqs, expected_domain, expected_critical):
         result = detect_domain(reqs)
-        self.assertEqual(result["domain"], "Library Management")
-        self.assertIn("Usability", result["critical_categories"])
+        assert result["domain"] == expected_domain
+        assert result["confidence"] > 0
+        assert expected_critical <= set(result["critical_categories"])
 
     def test_general_domain_when_no_keywords(self):
         reqs = [
             {"text": "The system shall do something.", "category": "Functionality", "confidence": 80},
         ]
         result = detect_domain(reqs)
-        self.assertEqual(result["domain"], "General")
-        self.assertEqual(result["confidence"], 0.0)
+        assert result["domain"] == "General"
+        assert result["confidence"] == 0.0
 
     def test_domain_from_raw_text(self):
         reqs = [{"text": "Requirement one", "category": "Functionality", "confidence": 80}]
         raw = "This banking application handles credit card transactions and loan management."
         result = detect_domain(reqs, raw_text=raw)
-        self.assertEqual(result["domain"], "Banking / Finance")
+        assert result["domain"] == "Banking / Finance"
 
-    def test_critical_categories_present(self):
+    def test_keyword_spanning_adjacent_requirements(self):
         reqs = [
-            {"text": "Process financial transaction.", "category": "Functionality", "confidence": 80},
-            {"text": "Secure bank transfer access.", "category": "Security", "confidence": 80},
+            {"text": "Items are tracked across the supply", "category": "Functionality", "confidence": 80},
+            {"text": "chain from start to finish.", "category": "Functionality", "confidence": 80},
         ]
         result = detect_domain(reqs)
-        self.assertIn("Security", result["critical_categories"])
-        self.assertIn("Reliability", result["critical_categories"])
+        assert result["domain"] == "Inventory / Warehouse"
+
+    def test_repeat_detection_is_not_affected_by_caller_mutation(self):
+        reqs = [{"text": "Patients book clinical appointments.", "category": "Functionality", "confidence": 80}]
+        first = detect_domain(reqs)
+        first["domain"] = "Mutated"
+        second = detect_domain(reqs)
+        assert second["domain"] == "Healthcare"
 
 
-class TestRecommendations(unittest.TestCase):
+class TestRecommendations:
 
     def test_empty_has_recommendations(self):
         scores = calculate_category_scores([])
         recs = generate_recommendations(scores)
-        self.assertGreater(len(recs), 0)
+        assert len(recs) > 0
 
     def test_domain_aware_recommendation(self):
         """Banking domain with missing Security should get a critical recommendation."""
@@ -135,9 +157,9 @@ class TestRecommendations(unittest.TestCase):
         }
         recs = generate_recommendations(scores, domain_info)
         sec_recs = [r for r in recs if r["category"] == "Security"]
-        self.assertEqual(len(sec_recs), 1)
-        self.assertEqual(sec_recs[0]["priority"], "critical")
-        self.assertIn("Banking / Finance", sec_recs[0]["message"])
+        assert len(sec_recs) == 1
+        assert sec_recs[0]["priority"] == "critical"
+        assert "Banking / Finance" in sec_recs[0]["message"]
 
     def test_full_coverage_no_high_recommendations(self):
         reqs = _make_classified(
@@ -148,7 +170,7 @@ class TestRecommendations(unittest.TestCase):
         scores = calculate_category_scores(reqs)
         recs = generate_recommendations(scores)
         high_recs = [r for r in recs if r["priority"] == "high"]
-        self.assertEqual(len(high_recs), 0)
+        assert len(high_recs) == 0
 
     def test_sorted_by_priority(self):
         scores = calculate_category_scores([])
@@ -160,17 +182,17 @@ class TestRecommendations(unittest.TestCase):
         recs = generate_recommendations(scores, domain_info)
         order = {"critical": 0, "high": 1, "medium": 2, "low": 3}
         priorities = [order.get(r["priority"], 99) for r in recs]
-        self.assertEqual(priorities, sorted(priorities))
+        assert priorities == sorted(priorities)
 
 
-class TestGapAnalysis(unittest.TestCase):
+class TestGapAnalysis:
 
     def test_all_missing(self):
         scores = calculate_category_scores([])
         gaps = generate_gap_analysis(scores)
-        self.assertEqual(len(gaps), len(ALL_CATEGORIES))
+        assert len(gaps) == len(ALL_CATEGORIES)
         for g in gaps:
-            self.assertEqual(g["gap_type"], "missing")
+            assert g["gap_type"] == "missing"
 
     def test_no_gaps_when_all_met(self):
         reqs = _make_classified(
@@ -180,25 +202,25 @@ class TestGapAnalysis(unittest.TestCase):
         )
         scores = calculate_category_scores(reqs)
         gaps = generate_gap_analysis(scores)
-        self.assertEqual(len(gaps), 0)
+        assert gaps == []
 
     def test_insufficient_gap(self):
         reqs = _make_classified(["Security"] * 1)  # needs 3
         scores = calculate_category_scores(reqs)
         gaps = generate_gap_analysis(scores)
         sec_gaps = [g for g in gaps if g["category"] == "Security"]
-        self.assertEqual(len(sec_gaps), 1)
-        self.assertEqual(sec_gaps[0]["gap_type"], "insufficient")
-        self.assertEqual(sec_gaps[0]["shortage"], 2)
+        assert len(sec_gaps) == 1
+        assert sec_gaps[0]["gap_type"] == "insufficient"
+        assert sec_gaps[0]["shortage"] == 2
 
 
-class TestBuildFullReport(unittest.TestCase):
+class TestBuildFullReport:
 
     def test_empty_input(self):
         report = build_full_report([])
-        self.assertEqual(report["total_requirements"], 0)
-        self.assertIsInstance(report["recommendations"], list)
-        self.assertIn("domain", report)
+        assert report["total_requirements"] == 0
+        assert isinstance(report["recommendations"], list)
+        assert "domain" in report
 
     def test_report_keys(self):
         reqs = _make_classified(["Functionality", "Security"])
@@ -208,24 +230,42 @@ class TestBuildFullReport(unittest.TestCase):
             "recommendations", "gap_analysis",
             "categories_present", "categories_missing",
         }
-        self.assertTrue(expected_keys.issubset(report.keys()))
+        assert expected_keys.issubset(report.keys())
         # overall_score and risk should NOT be in the new report
-        self.assertNotIn("overall_score", report)
-        self.assertNotIn("risk", report)
+        assert "overall_score" not in report
+        assert "risk" not in report
 
     def test_domain_in_report(self):
         reqs = _make_classified(["Functionality", "Security"])
         report = build_full_report(reqs)
-        self.assertIn("domain", report["domain"])
-        self.assertIn("confidence", report["domain"])
+        assert "domain" in report["domain"]
+        assert "confidence" in report["domain"]
 
     def test_categories_present_and_missing(self):
         reqs = _make_classified(["Functionality", "Security"])
         report = build_full_report(reqs)
-        self.assertIn("Functionality", report["categories_present"])
-        self.assertIn("Security", report["categories_present"])
-        self.assertIn("Portability", report["categories_missing"])
+        assert "Functionality" in report["categories_present"]
+        assert "Security" in report["categories_present"]
+        assert "Portability" in report["categories_missing"]
+
+    def test_repeat_call_returns_independent_copy(self):
+        reqs = _make_classified(["Functionality", "Security", "Security"])
+        first = build_full_report(reqs, raw_text="Online banking portal")
+        first["categories_present"].append("Mutated")
+        first["category_scores"]["Security"]["count"] = 99
+        second = build_full_report(reqs, raw_text="Online banking portal")
+        assert "Mutated" not in second["categories_present"]
+        assert second["category_scores"]["Security"]["count"] == 2
+
+    def test_domain_detection_is_not_cached(self):
+        reqs = _make_classified(["Functionality", "Security"])
+        with mock.patch(
+            "services.quality_scorer.detect_domain_with_gemini", return_value=None,
+        ) as gemini:
+            build_full_report(reqs, raw_text="Online banking portal")
+            build_full_report(reqs, raw_text="Online banking portal")
+        assert gemini.call_count == 2
 
 
 if __name__ == "__main__":
-    unittest.main(verbosity=2)
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -9,89 +9,75 @@ Run from backend/ directory:
 
 import os
 import sys
-import unittest
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import pytest
+
+if __name__ == "__main__":  # standalone run; under pytest backend/ is already on sys.path
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from services.requirement_extractor import (
     extract_requirements,
+    extract_requirements_batch,
+    extract_requirements_parallel,
     get_requirement_texts,
 )
 
 
-class TestExtractRequirements(unittest.TestCase):
+# (text, expected total_found, expected keyword_strength of the first match)
+KEYWORD_CASES = [
+    pytest.param("The system shall authenticate all users before granting access.",
+                 1, "strong", id="shall"),
+    pytest.param("All passwords must be stored using bcrypt hashing with a salt.",
+                 1, "strong", id="must"),
+    pytest.param("The application should provide an audit log of all administrative actions.",
+                 1, "strong", id="should"),
+    pytest.param("The platform supports multi-factor authentication for all user accounts.",
+                 1, "weak", id="weak-supports"),
+    pytest.param("The system ensures data integrity across all distributed transactions.",
+                 1, "weak", id="weak-ensures"),
+    # Shorter than MIN_LENGTH (20)
+    pytest.param("Must login.", 0, None, id="too-short"),
+    # No requirement keyword at all
+    pytest.param("This is a normal description of a blue button on the homepage.",
+                 0, None, id="non-requirement"),
+]
+
+
+class TestExtractRequirements:
     """Core tests for the requirement extraction pipeline."""
 
     # ── Basic functionality ───────────────────────────────────────────── #
 
     def test_empty_text(self):
         result = extract_requirements("")
-        self.assertEqual(result["total_found"], 0)
-        self.assertEqual(result["requirements"], [])
+        assert result["total_found"] == 0
+        assert result["requirements"] == []
 
     def test_whitespace_only(self):
         result = extract_requirements("   \n\n  \t  ")
-        self.assertEqual(result["total_found"], 0)
+        assert result["total_found"] == 0
 
     def test_none_safe(self):
         """None-like input handled gracefully."""
         result = extract_requirements("")
-        self.assertIn("requirements", result)
-        self.assertIn("extraction_stats", result)
-
-    # ── Strong keyword detection ──────────────────────────────────────── #
+        assert "requirements" in result
+        assert "extraction_stats" in result
 
-    def test_shall_keyword(self):
-        text = "The system shall authenticate all users before granting access."
-        result = extract_requirements(text)
-        self.assertEqual(result["total_found"], 1)
-        self.assertEqual(result["requirements"][0]["keyword_strength"], "strong")
+    # ── Keyword detection and filtering ───────────────────────────────── #
 
-    def test_must_keyword(self):
-        text = "All passwords must be stored using bcrypt hashing with a salt."
+    @pytest.mark.parametrize("text,expected_total,expected_strength", KEYWORD_CASES)
+    def test_keyword_detection(self, text, expected_total, expected_strength):
         result = extract_requirements(text)
-        self.assertEqual(result["total_found"], 1)
-        self.assertEqual(result["requirements"][0]["keyword_strength"], "strong")
-
-    def test_should_keyword(self):
-        text = "The application should provide an audit log of all administrative actions."
-        result = extract_requirements(text)
-        self.assertEqual(result["total_found"], 1)
-        self.assertEqual(result["requirements"][0]["keyword_strength"], "strong")
+        assert result["total_found"] == expected_total
+        if expected_strength is not None:
+            assert result["requirements"][0]["keyword_strength"] == expected_strength
 
     def test_negative_keyword(self):
         text = "The system shall not expose internal error details to end users."
         result = extract_requirements(text)
-        self.assertGreaterEqual(result["total_found"], 1)
+        assert result["total_found"] >= 1
         matched = [r for r in result["requirements"] if "shall not" in r["text"].lower()]
-        self.assertTrue(len(matched) > 0 or result["total_found"] >= 1)
-
-    # ── Weak keyword detection ────────────────────────────────────────── #
-
-    def test_weak_keyword_supports(self):
-        text = "The platform supports multi-factor authentication for all user accounts."
-        result = extract_requirements(text)
-        self.assertEqual(result["total_found"], 1)
-        self.assertEqual(result["requirements"][0]["keyword_strength"], "weak")
-
-    def test_weak_keyword_ensures(self):
-        text = "The system ensures data integrity across all distributed transactions."
-        result = extract_requirements(text)
-        self.assertEqual(result["total_found"], 1)
-
-    # ── Filtering ─────────────────────────────────────────────────────── #
-
-    def test_too_short_filtered(self):
-        """Text shorter than MIN_LENGTH (20) should be excluded."""
-        text = "Must login."
-        result = extract_requirements(text)
-        self.assertEqual(result["total_found"], 0)
-
-    def test_non_requirement_filtered(self):
-        """Lines without any requirement keyword are excluded."""
-        text = "This is a normal description of a blue button on the homepage."
-        result = extract_requirements(text)
-        self.assertEqual(result["total_found"], 0)
+        assert len(matched) > 0 or result["total_found"] >= 1
 
     # ── Multi-requirement extraction ──────────────────────────────────── #
 
@@ -104,7 +90,7 @@ class TestExtractRequirements(unittest.TestCase):
             "The software shall provide an audit log of all user actions.\n"
         )
         result = extract_requirements(text)
-        self.assertGreaterEqual(result["total_found"], 3)
+        assert result["total_found"] >= 3
 
     def test_numbered_list(self):
         text = (
@@ -113,7 +99,7 @@ class TestExtractRequirements(unittest.TestCase):
             "3. Normal text without keywords here.\n"
         )
         result = extract_requirements(text)
-        self.assertGreaterEqual(result["total_found"], 2)
+        assert result["total_found"] >= 2
 
     def test_bullet_list(self):
         text = (
@@ -122,7 +108,19 @@ class TestExtractRequirements(unittest.TestCase):
             "- System overview diagram section.\n"
         )
         result = extract_requirements(text)
-        self.assertGreaterEqual(result["total_found"], 2)
+        assert result["total_found"] >= 2
+
+    def test_marker_only_lines_are_not_candidates(self):
+        """Empty list items ("1.", "-") are stripped, even on the last line."""
+        text = (
+            "1.\n"
+            "The system shall validate all user input.\n"
+            "-\n"
+            "2."
+        )
+        result = extract_requirements(text)
+        assert result["total_candidates"] == 1
+        assert result["total_found"] == 1
 
     # ── Extraction stats ──────────────────────────────────────────────── #
 
@@ -130,9 +128,9 @@ class TestExtractRequirements(unittest.TestCase):
         text = "The system shall authenticate users. The app must respond in 2 seconds."
         result = extract_requirements(text)
         stats = result["extraction_stats"]
-        self.assertIn("strong_keyword_matches", stats)
-        self.assertIn("weak_keyword_matches", stats)
-        self.assertIn("filtered_out", stats)
+        assert "strong_keyword_matches" in stats
+        assert "weak_keyword_matches" in stats
+        assert "filtered_out" in stats
 
     def test_total_candidates_gte_total_found(self):
         text = (
@@ -141,7 +139,7 @@ class TestExtractRequirements(unittest.TestCase):
             "All passwords must be hashed using bcrypt.\n"
         )
         result = extract_requirements(text)
-        self.assertGreaterEqual(result["total_candidates"], result["total_found"])
+        assert result["total_candidates"] >= result["total_found"]
 
     # ── Result structure ──────────────────────────────────────────────── #
 
@@ -150,29 +148,51 @@ class TestExtractRequirements(unittest.TestCase):
         result = extract_requirements(text)
         req = result["requirements"][0]
         expected_keys = {"text", "source_index", "has_keyword", "keyword_strength", "matched_keywords"}
-        self.assertTrue(expected_keys.issubset(req.keys()))
+        assert expected_keys.issubset(req.keys())
 
     def test_source_index_is_int(self):
         text = "The system shall authenticate users. The app must encrypt data."
         result = extract_requirements(text)
         for req in result["requirements"]:
-            self.assertIsInstance(req["source_index"], int)
+            assert isinstance(req["source_index"], int)
+
+
+class TestExtractRequirementsBatch:
+
+    DOC_A = "The system shall encrypt all stored passwords.\nUsers must log in with MFA."
+    DOC_B = "The system shall encrypt all stored passwords.\nReports should export to PDF."
+
+    def test_matches_single_document_calls(self):
+        results = extract_requirements_batch([self.DOC_A, self.DOC_B])
+        assert results == [extract_requirements(self.DOC_A), extract_requirements(self.DOC_B)]
+
+    def test_shared_seen_dedups_across_documents(self):
+        seen = set()
+        first, second = extract_requirements_batch([self.DOC_A, self.DOC_B], shared_seen=seen)
+        assert first["total_found"] == 2
+        assert [r["text"] for r in second["requirements"]] == ["Reports should export to PDF."]
+        assert "The system shall encrypt all stored passwords." in seen
+
+    def test_parallel_matches_batch(self):
+        texts = [self.DOC_A, self.DOC_B, "", self.DOC_A]
+        results = extract_requirements_parallel(texts, max_workers=2)
+        assert results == extract_requirements_batch(texts)
 
 
-class TestGetRequirementTexts(unittest.TestCase):
+class TestGetRequirementTexts:
 
     def test_returns_strings(self):
         text = "The system shall authenticate users. The app must encrypt passwords."
         extraction = extract_requirements(text)
         texts = get_requirement_texts(extraction)
-        self.assertIsInstance(texts, list)
+        assert isinstance(texts, list)
         for t in texts:
-            self.assertIsInstance(t, str)
+            assert isinstance(t, str)
 
     def test_empty_extraction(self):
         texts = get_requirement_texts({"requirements": []})
-        self.assertEqual(texts, [])
+        assert texts == []
 
 
 if __name__ == "__main__":
-    unittest.main(verbosity=2)
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -11,11 +11,11 @@ Provides
 - handle_exception()  – catch-all wrapper for route functions
 """
 
-import traceback
 from functools import wraps
 from typing import Any, Dict, Optional, Tuple
 
 from flask import Flask, jsonify
+from werkzeug.exceptions import HTTPException
 
 from utils.logger import app_logger
 
@@ -105,13 +105,11 @@ def handle_exception(func):
         try:
             return func(*args, **kwargs)
         except AppError as exc:
-            app_logger.warning(f"AppError [{exc.status_code}]: {exc.message}")
+            app_logger.warning("AppError [%s]: %s", exc.status_code, exc.message)
             return error_response(exc.message, exc.status_code, exc.details)
         except Exception as exc:
-            app_logger.error(
-                f"Unhandled exception in {func.__name__}: {exc}\n"
-                + traceback.format_exc()
-            )
+            # exception() defers traceback formatting to the handlers
+            app_logger.exception("Unhandled exception in %s: %s", func.__name__, exc)
             return error_response("An unexpected server error occurred.", 500)
     return wrapper
 
@@ -120,6 +118,17 @@ def handle_exception(func):
 # Flask-level error handlers                                                    #
 # ──────────────────────────────────────────────────────────────────────────── #
 
+_HTTP_ERROR_MESSAGES: Dict[int, str] = {
+    400: "Bad request. Check your input.",
+    404: "Endpoint not found.",
+    405: "HTTP method not allowed for this endpoint.",
+    413: "File too large. Maximum allowed size is 10 MB.",
+    422: "Could not process the provided data.",
+    429: "Rate limit exceeded. Please slow down.",
+    500: "Internal server error.",
+}
+
+
 def register_handlers(app: Flask) -> None:
     """
     Register HTTP-level error handlers on the Flask app instance.
@@ -130,33 +139,13 @@ def register_handlers(app: Flask) -> None:
     def handle_app_error(exc: AppError):
         return error_response(exc.message, exc.status_code, exc.details)
 
-    @app.errorhandler(400)
-    def bad_request(e):
-        return error_response("Bad request. Check your input.", 400)
-
-    @app.errorhandler(404)
-    def not_found(e):
-        return error_response("Endpoint not found.", 404)
-
-    @app.errorhandler(405)
-    def method_not_allowed(e):
-        return error_response("HTTP method not allowed for this endpoint.", 405)
-
-    @app.errorhandler(413)
-    def request_entity_too_large(e):
-        return error_response("File too large. Maximum allowed size is 10 MB.", 413)
-
-    @app.errorhandler(422)
-    def unprocessable(e):
-        return error_response("Could not process the provided data.", 422)
-
-    @app.errorhandler(429)
-    def rate_limit_exceeded(e):
-        return error_response("Rate limit exceeded. Please slow down.", 429)
-
-    @app.errorhandler(500)
-    def internal_error(e):
-        app_logger.error(f"HTTP 500: {e}")
-        return error_response("Internal server error.", 500)
+    @app.errorhandler(HTTPException)
+    def handle_http_error(e: HTTPException):
+        message = _HTTP_ERROR_MESSAGES.get(e.code)
+        if message is None:
+            return e  # keep Werkzeug's default response for unmapped codes
+        if e.code == 500:
+            app_logger.error("HTTP 500: %s", e)
+        return error_response(message, e.code)
 
     app_logger.debug("Flask error handlers registered.")
@@ -1,16 +1,24 @@
 import os
-import uuid
-from datetime import datetime, timezone
+import time
+from typing import Optional, Set
 
 from utils.logger import app_logger
 from utils.validators import sanitize_filename
 
 
+# Directories already created or confirmed by ensure_directories(), so each
+# upload does not repeat the makedirs syscall. set.add is atomic under the GIL.
+_ENSURED: Set[str] = set()
+
+
 def ensure_directories(*paths: str) -> None:
     """Create one or more directories (including parents) if they do not exist."""
     for path in paths:
+        if path in _ENSURED:
+            continue
         os.makedirs(path, exist_ok=True)
-        app_logger.debug(f"Directory ready: {path}")
+        _ENSURED.add(path)
+        app_logger.debug("Directory ready: %s", path)
 
 
 def save_uploaded_file(file, upload_folder: str) -> dict:
@@ -31,15 +39,28 @@ def save_uploaded_file(file, upload_folder: str) -> dict:
     original_name = sanitize_filename(file.filename)
     file_id = create_analysis_id()
 
-    # Preserve the original extension
-    ext = original_name.rsplit(".", 1)[-1] if "." in original_name else "bin"
+    # Preserve the original extension (sanitize_filename strips leading and
+    # trailing dots, so splitext agrees with a last-dot split here)
+    ext = os.path.splitext(original_name)[1][1:] or "bin"
     saved_name = f"{file_id}.{ext}"
     file_path = os.path.join(upload_folder, saved_name)
 
-    file.save(file_path)
-    size_bytes = os.path.getsize(file_path)
+    # Measure the upload from its in-memory/spooled stream rather than
+    # stat-ing the saved file afterwards
+    size_bytes = _remaining_stream_size(file.stream)
+
+    try:
+        file.save(file_path)
+    except FileNotFoundError:
+        # The folder was removed after it was ensured; recreate it and retry.
+        # save() opens the destination before reading the upload stream.
+        _ENSURED.discard(upload_folder)
+        ensure_directories(upload_folder)
+        file.save(file_path)
+    if size_bytes is None:
+        size_bytes = os.path.getsize(file_path)
 
-    app_logger.info(f"File saved → {file_path} ({size_bytes} bytes)")
+    app_logger.info("File saved → %s (%d bytes)", file_path, size_bytes)
 
     return {
         "file_id": file_id,
@@ -50,6 +71,17 @@ def save_uploaded_file(file, upload_folder: str) -> dict:
     }
 
 
+def _remaining_stream_size(stream) -> Optional[int]:
+    """Bytes left from the stream's current position, or None if it cannot seek."""
+    try:
+        start = stream.tell()
+        end = stream.seek(0, os.SEEK_END)
+        stream.seek(start)
+    except (AttributeError, OSError, ValueError):
+        return None
+    return end - start
+
+
 def delete_temp_file(file_path: str) -> bool:
     """
     Delete a file from disk.
@@ -60,12 +92,15 @@ def delete_temp_file(file_path: str) -> bool:
     Returns:
         True if deleted, False if the file did not exist.
     """
-    if os.path.exists(file_path):
+    # One unlink instead of stat + unlink, and no window for the file to
+    # vanish between the check and the removal
+    try:
         os.remove(file_path)
-        app_logger.info(f"Temp file deleted: {file_path}")
-        return True
-    app_logger.warning(f"File not found for deletion: {file_path}")
-    return False
+    except FileNotFoundError:
+        app_logger.warning("File not found for deletion: %s", file_path)
+        return False
+    app_logger.info("Temp file deleted: %s", file_path)
+    return True
 
 
 def create_analysis_id() -> str:
@@ -78,6 +113,7 @@ def create_analysis_id() -> str:
     Returns:
         Unique string ID.
     """
-    timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
-    short_uuid = uuid.uuid4().hex[:8]
-    return f"{timestamp}_{short_uuid}"
+    # Same shape as a UTC datetime stamp + uuid4().hex[:8] (whose first
+    # 8 hex digits are fully random), without building either object
+    timestamp = time.strftime("%Y%m%d_%H%M%S", time.gmtime())
+    return f"{timestamp}_{os.urandom(4).hex()}"
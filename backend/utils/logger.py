@@ -1,7 +1,43 @@
+import atexit
 import logging
 import os
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+
+class _SecondCachedFormatter(logging.Formatter):
+    """
+    Formatter that reuses the formatted timestamp within the same second.
+
+    The date format has one-second resolution, so localtime() + strftime()
+    only need to run once per second rather than once per record.
+    """
+
+    _last = (None, "")
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str = None) -> str:
+        second = int(record.created)
+        cached_second, cached_text = self._last
+        if second == cached_second:
+            return cached_text
+        text = super().formatTime(record, datefmt)
+        self._last = (second, text)
+        return text
+
+
+class _InProcessQueueHandler(QueueHandler):
+    """
+    QueueHandler that enqueues records as they are.
+
+    The stock prepare() formats the message and traceback on the logging
+    thread (and copies the record) so it can be pickled to another process.
+    Our queue never leaves the process, so formatting is left to the file
+    handler on the listener thread.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
 
 
 def setup_logger(name: str, log_file: str = None, level: str = "DEBUG") -> logging.Logger:
@@ -18,7 +54,7 @@ def setup_logger(name: str, log_file: str = None, level: str = "DEBUG") -> loggi
     """
     numeric_level = getattr(logging, level.upper(), logging.DEBUG)
 
-    formatter = logging.Formatter(
+    formatter = _SecondCachedFormatter(
         fmt="%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S",
     )
@@ -35,12 +71,22 @@ def setup_logger(name: str, log_file: str = None, level: str = "DEBUG") -> loggi
     console_handler.setFormatter(formatter)
     logger.addHandler(console_handler)
 
-    # File handler (rotating: max 5 MB, keep 3 backups)
+    # File handler (rotating: max 5 MB, keep 3 backups). Request threads only
+    # enqueue records; a QueueListener thread formats them and does the disk
+    # writes, so file formatting, log I/O and rollover never hold up (or
+    # serialise) request handling.
     if log_file:
         os.makedirs(os.path.dirname(log_file), exist_ok=True)
         file_handler = RotatingFileHandler(log_file, maxBytes=5 * 1024 * 1024, backupCount=3)
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+
+        records: queue.SimpleQueue = queue.SimpleQueue()
+        logger.addHandler(_InProcessQueueHandler(records))
+        listener = QueueListener(records, file_handler, respect_handler_level=True)
+        listener.start()
+        # Drain what is still queued when the interpreter exits
+        atexit.register(listener.stop)
+        logger.queue_listener = listener
 
     return logger
 
@@ -50,10 +96,10 @@ def _init_app_logger() -> logging.Logger:
     """Initialise the application logger with the configured log file."""
     try:
         from config import Config
-        return setup_logger("qualitymapai", log_file=Config.LOG_FILE, level=Config.LOG_LEVEL)
-    except Exception:
+    except ImportError:
         # Fallback: console-only logging if config is unavailable
         return setup_logger("qualitymapai")
+    return setup_logger("qualitymapai", log_file=Config.LOG_FILE, level=Config.LOG_LEVEL)
 
 
 app_logger = _init_app_logger()
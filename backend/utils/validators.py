@@ -1,28 +1,25 @@
 import os
 import re
 import unicodedata
+from functools import lru_cache
 
 
-def _get_allowed_extensions() -> set:
-    try:
-        from config import Config
-        return Config.ALLOWED_EXTENSIONS
-    except Exception:
-        return {"pdf", "docx"}
+try:
+    from config import Config
+except ImportError:
+    # Imported outside the backend (e.g. standalone scripts): use the defaults
+    Config = None
 
 
-def _get_max_file_size() -> int:
-    try:
-        from config import Config
-        return Config.MAX_CONTENT_LENGTH
-    except Exception:
-        return 10 * 1024 * 1024
-
-
-ALLOWED_EXTENSIONS = _get_allowed_extensions()
-MAX_FILE_SIZE_BYTES = _get_max_file_size()
+ALLOWED_EXTENSIONS = Config.ALLOWED_EXTENSIONS if Config else {"pdf", "docx"}
+MAX_FILE_SIZE_BYTES = Config.MAX_CONTENT_LENGTH if Config else 10 * 1024 * 1024
 MAX_FILE_SIZE_MB = MAX_FILE_SIZE_BYTES / (1024 * 1024)
 
+# sanitize_filename patterns
+_UNSAFE_CHARS_RE = re.compile(r"[^\w.\-]")
+_DOT_RUN_RE = re.compile(r"\.{2,}")
+_UNDERSCORE_RUN_RE = re.compile(r"_{2,}")
+
 
 def validate_file_type(filename: str) -> bool:
     """
@@ -34,10 +31,10 @@ def validate_file_type(filename: str) -> bool:
     Returns:
         True if allowed, False otherwise.
     """
-    if not filename or "." not in filename:
+    if not filename:
         return False
-    ext = filename.rsplit(".", 1)[1].lower()
-    return ext in ALLOWED_EXTENSIONS
+    _, dot, ext = filename.rpartition(".")
+    return bool(dot) and ext.lower() in ALLOWED_EXTENSIONS
 
 
 def validate_file_size(file) -> bool:
@@ -58,6 +55,7 @@ def validate_file_size(file) -> bool:
     return size <= MAX_FILE_SIZE_BYTES
 
 
+@lru_cache(maxsize=1024)
 def sanitize_filename(filename: str) -> str:
     """
     Remove or replace characters that are unsafe in filenames.
@@ -73,16 +71,17 @@ def sanitize_filename(filename: str) -> str:
     Returns:
         Sanitized filename safe to write to disk.
     """
-    # Normalize unicode characters
-    filename = unicodedata.normalize("NFKD", filename)
-    filename = filename.encode("ascii", "ignore").decode("ascii")
+    # Normalize unicode characters (NFKD leaves ASCII untouched)
+    if not filename.isascii():
+        filename = unicodedata.normalize("NFKD", filename)
+        filename = filename.encode("ascii", "ignore").decode("ascii")
 
     # Keep only safe characters
-    filename = re.sub(r"[^\w.\-]", "_", filename)
+    filename = _UNSAFE_CHARS_RE.sub("_", filename)
 
     # Collapse multiple consecutive dots/underscores/hyphens
-    filename = re.sub(r"\.{2,}", ".", filename)
-    filename = re.sub(r"_{2,}", "_", filename)
+    filename = _DOT_RUN_RE.sub(".", filename)
+    filename = _UNDERSCORE_RUN_RE.sub("_", filename)
 
     # Strip leading/trailing dots and underscores
     filename = filename.strip("._")
@@ -96,6 +95,5 @@ def sanitize_filename(filename: str) -> str:
 
 def get_extension(filename: str) -> str:
     """Return the lowercase file extension without the leading dot."""
-    if "." not in filename:
-        return ""
-    return filename.rsplit(".", 1)[1].lower()
+    _, dot, ext = filename.rpartition(".")
+    return ext.lower() if dot else ""
@@ -7,7 +7,7 @@ This script:
 3. Maps ALL category codes to ISO/IEC 9126 standard (7 categories)
 4. Classifies NFR (generic non-functional) requirements using keywords
 5. Cleans text (encoding issues, whitespace, vague requirements)
-6. Removes duplicates
+6. Removes duplicates (and, with --near-dedup, near-duplicate paraphrases)
 7. Merges both datasets
 8. Adds sub-categories and keywords
 9. Balances and validates
@@ -21,12 +21,30 @@ ISO/IEC 9126 Categories:
 5. Efficiency
 6. Maintainability
 7. Portability
+
+Usage:
+    python process_dataset.py [--near-dedup]
+
+Requires:
+    pip install pyahocorasick
+    pip install datasketch     # only for --near-dedup
 """
 
+import argparse
 import csv
 import re
 import os
-from collections import Counter
+import sys
+from collections import Counter, defaultdict
+from functools import lru_cache
+
+# Check for required libraries
+try:
+    import ahocorasick
+except ImportError as e:
+    print(f"ERROR: Missing required library - {e}")
+    print("Install with: pip install pyahocorasick")
+    sys.exit(1)
 
 # ============================================================
 # CONFIGURATION
@@ -176,36 +194,101 @@ SUBCATEGORY_KEYWORDS = {
     },
 }
 
+# Default sub-category per category: the first one listed above
+FIRST_SUBCATEGORY = {cat: next(iter(subs)) for cat, subs in SUBCATEGORY_KEYWORDS.items()}
+
+
+# Precompiled patterns for the per-row helpers and the dedup pass
+WS_RE = re.compile(r'\s+')
+NON_ALNUM_RE = re.compile(r'[^a-zA-Z0-9\s]')
+WORD_RE = re.compile(r'[a-zA-Z]+')
+
+# Too-vague requirement texts, matched against the lowercased text
+VAGUE_RE = re.compile(
+    r'^(?:the system|the product|the application|n/a|none|todo|tbd|not applicable)$'
+)
+
+
+# Common stopwords dropped by extract_keywords
+STOPWORDS = frozenset({
+    'the', 'a', 'an', 'is', 'are', 'was', 'were', 'be', 'been', 'being',
+    'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could',
+    'should', 'may', 'might', 'shall', 'can', 'must', 'need', 'to', 'of',
+    'in', 'for', 'on', 'with', 'at', 'by', 'from', 'as', 'into', 'through',
+    'during', 'before', 'after', 'above', 'below', 'between', 'out', 'off',
+    'up', 'down', 'then', 'once', 'here', 'there', 'when', 'where', 'why',
+    'how', 'all', 'each', 'every', 'both', 'few', 'more', 'most', 'other',
+    'some', 'such', 'no', 'nor', 'not', 'only', 'same', 'so', 'than',
+    'too', 'very', 'just', 'because', 'but', 'and', 'or', 'if', 'while',
+    'that', 'this', 'these', 'those', 'it', 'its', 'they', 'them', 'their',
+    'we', 'our', 'he', 'she', 'his', 'her', 'my', 'your', 'any', 'also',
+    'which', 'who', 'whom', 'what', 'about', 'over', 'under', 'again',
+    'further', 'product', 'system', 'application', 'software', 'user',
+    'users', 'able', 'within', 'time', 'using', 'used', 'use', 'new',
+    'provide', 'provided', 'upon', 'per', 'been', 'without', 'either',
+    'following',
+})
+
+
+# Inverted index: keyword -> every list it appears in, tagged as a category
+# (NFR_CLASSIFICATION_KEYWORDS) or a (category, sub_category) pair
+# (SUBCATEGORY_KEYWORDS)
+KEYWORD_TAGS = defaultdict(list)
+for _category, _keywords in NFR_CLASSIFICATION_KEYWORDS.items():
+    for _kw in _keywords:
+        KEYWORD_TAGS[_kw].append(_category)
+for _category, _subs in SUBCATEGORY_KEYWORDS.items():
+    for _sub_cat, _keywords in _subs.items():
+        for _kw in _keywords:
+            KEYWORD_TAGS[_kw].append((_category, _sub_cat))
+
+# One Aho-Corasick automaton over every keyword, so each text is scanned
+# once instead of once per keyword
+KEYWORD_AUTOMATON = ahocorasick.Automaton()
+for _kw, _tags in KEYWORD_TAGS.items():
+    KEYWORD_AUTOMATON.add_word(_kw, (_kw, tuple(_tags)))
+KEYWORD_AUTOMATON.make_automaton()
+
 
 # ============================================================
 # HELPER FUNCTIONS
 # ============================================================
 
+@lru_cache(maxsize=4096)
+def keyword_tally(text_lower):
+    """
+    Count, per category and per (category, sub_category), how many of its
+    keywords occur as substrings of the lowercased text. Read-only: the
+    result is cached and shared between the classification helpers.
+    """
+    hits = {kw: tags for _, (kw, tags) in KEYWORD_AUTOMATON.iter(text_lower)}
+    return Counter(tag for tags in hits.values() for tag in tags)
+
+
 def clean_text(text):
     """Clean requirement text: fix encoding, whitespace, etc."""
     if not text:
         return ''
     
-    # Fix common encoding issues
-    text = text.replace('ï¿½', "'")  # UTF-8 replacement character
-    text = text.replace('â€™', "'")
-    text = text.replace('â€œ', '"')
-    text = text.replace('â€\x9d', '"')
-    text = text.replace('â€"', '-')
-    text = text.replace('â€"', '-')
-    text = text.replace('\x92', "'")
-    text = text.replace('\x93', '"')
-    text = text.replace('\x94', '"')
-    text = text.replace('\x96', '-')
+    # Fix common encoding issues (all of them are non-ASCII, so plain
+    # ASCII text - the common case - skips the replacement chain)
+    if not text.isascii():
+        text = text.replace('ï¿½', "'")  # UTF-8 replacement character
+        text = text.replace('â€™', "'")
+        text = text.replace('â€œ', '"')
+        text = text.replace('â€\x9d', '"')
+        text = text.replace('â€"', '-')
+        text = text.replace('â€"', '-')
+        text = text.replace('\x92', "'")
+        text = text.replace('\x93', '"')
+        text = text.replace('\x94', '"')
+        text = text.replace('\x96', '-')
     
     # Replace multiple spaces with single space
-    text = re.sub(r'\s+', ' ', text)
-    
-    # Remove leading/trailing whitespace
-    text = text.strip()
+    text = WS_RE.sub(' ', text)
     
-    # Remove leading/trailing punctuation artifacts
-    text = text.strip('.,;: ')
+    # Remove leading/trailing whitespace and punctuation artifacts
+    text = text.strip(' .,;:')
     
     # Ensure it starts with a capital letter
     if text and text[0].islower():
@@ -229,37 +312,21 @@ def is_valid_requirement(text):
         return False
     
     # Too vague patterns
-    vague_patterns = [
-        r'^the system$',
-        r'^the product$',
-        r'^the application$',
-        r'^n/a$',
-        r'^none$',
-        r'^todo$',
-        r'^tbd$',
-        r'^not applicable$',
-    ]
-    text_lower = text.lower().strip()
-    for pattern in vague_patterns:
-        if re.match(pattern, text_lower):
-            return False
+    if VAGUE_RE.match(text.lower().strip()):
+        return False
     
     return True
 
 
 def classify_nfr(text):
     """Classify a generic NFR requirement into ISO category."""
-    text_lower = text.lower()
+    tally = keyword_tally(text.lower())
     scores = {}
     
-    for category, keywords in NFR_CLASSIFICATION_KEYWORDS.items():
+    for category in NFR_CLASSIFICATION_KEYWORDS:
         if category == 'Functionality':
             continue  # Skip Functionality for NFR - it should be non-functional
-        score = 0
-        for keyword in keywords:
-            if keyword in text_lower:
-                score += 1
-        scores[category] = score
+        scores[category] = tally[category]
     
     # If no clear match, check for Functionality as fallback
     if max(scores.values(), default=0) == 0:
@@ -286,47 +353,25 @@ def classify_nfr(text):
 
 def determine_subcategory(text, category):
     """Determine the sub-category within a main ISO category."""
-    text_lower = text.lower()
-    
     if category not in SUBCATEGORY_KEYWORDS:
         return 'General'
     
+    tally = keyword_tally(text.lower())
     scores = {}
-    for sub_cat, keywords in SUBCATEGORY_KEYWORDS[category].items():
-        score = sum(1 for kw in keywords if kw in text_lower)
-        scores[sub_cat] = score
+    for sub_cat in SUBCATEGORY_KEYWORDS[category]:
+        scores[sub_cat] = tally[(category, sub_cat)]
     
     if max(scores.values(), default=0) == 0:
         # Return first sub-category as default
-        return list(SUBCATEGORY_KEYWORDS[category].keys())[0]
+        return FIRST_SUBCATEGORY[category]
     
     return max(scores, key=scores.get)
 
 
 def extract_keywords(text, max_keywords=5):
     """Extract relevant keywords from requirement text."""
-    # Common stopwords
-    stopwords = {
-        'the', 'a', 'an', 'is', 'are', 'was', 'were', 'be', 'been', 'being',
-        'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could',
-        'should', 'may', 'might', 'shall', 'can', 'must', 'need', 'to', 'of',
-        'in', 'for', 'on', 'with', 'at', 'by', 'from', 'as', 'into', 'through',
-        'during', 'before', 'after', 'above', 'below', 'between', 'out', 'off',
-        'up', 'down', 'then', 'once', 'here', 'there', 'when', 'where', 'why',
-        'how', 'all', 'each', 'every', 'both', 'few', 'more', 'most', 'other',
-        'some', 'such', 'no', 'nor', 'not', 'only', 'same', 'so', 'than',
-        'too', 'very', 'just', 'because', 'but', 'and', 'or', 'if', 'while',
-        'that', 'this', 'these', 'those', 'it', 'its', 'they', 'them', 'their',
-        'we', 'our', 'he', 'she', 'his', 'her', 'my', 'your', 'any', 'also',
-        'which', 'who', 'whom', 'what', 'about', 'over', 'under', 'again',
-        'further', 'product', 'system', 'application', 'software', 'user',
-        'users', 'able', 'within', 'time', 'using', 'used', 'use', 'new',
-        'provide', 'provided', 'upon', 'per', 'been', 'without', 'either',
-        'following',
-    }
-    
-    words = re.findall(r'[a-zA-Z]+', text.lower())
-    filtered = [w for w in words if w not in stopwords and len(w) > 2]
+    words = WORD_RE.findall(text.lower())
+    filtered = [w for w in words if w not in STOPWORDS and len(w) > 2]
     
     # Count frequency
     freq = Counter(filtered)
@@ -341,11 +386,9 @@ def determine_confidence(text, category, original_code):
         # NFR was auto-classified, lower confidence
         return 'Medium'
     
-    text_lower = text.lower()
-    
     # Check if the text clearly matches the category
     if category in NFR_CLASSIFICATION_KEYWORDS:
-        matches = sum(1 for kw in NFR_CLASSIFICATION_KEYWORDS[category] if kw in text_lower)
+        matches = keyword_tally(text.lower())[category]
         if matches >= 3:
             return 'High'
         elif matches >= 1:
@@ -358,11 +401,51 @@ def determine_confidence(text, category, original_code):
     return 'Medium'
 
 
+def char_shingles(text, n=3):
+    """Set of overlapping n-character shingles of the normalized text."""
+    text = WS_RE.sub(' ', text.lower()).strip()
+    return {text[i:i + n] for i in range(max(len(text) - n + 1, 1))}
+
+
+def remove_near_duplicates(rows, threshold=0.85, num_perm=64):
+    """
+    Drop rows whose text is a near-duplicate of an earlier row.
+
+    Uses MinHash signatures over character 3-shingles with LSH banding, so
+    candidates are found without comparing every pair. Rows are kept in
+    order; the first of each near-duplicate group wins.
+
+    Returns:
+        (kept_rows, dropped_count)
+    """
+    try:
+        from datasketch import MinHash, MinHashLSH
+    except ImportError as e:
+        print(f"ERROR: Missing required library - {e}")
+        print("Install with: pip install datasketch")
+        sys.exit(1)
+    
+    lsh = MinHashLSH(threshold=threshold, num_perm=num_perm)
+    signatures = {}
+    kept = []
+    for i, row in enumerate(rows):
+        mh = MinHash(num_perm=num_perm)
+        mh.update_batch([s.encode('utf-8') for s in char_shingles(row['text'])])
+        # LSH candidates are probabilistic; confirm with the estimated Jaccard
+        if any(mh.jaccard(signatures[j]) >= threshold for j in lsh.query(mh)):
+            continue
+        lsh.insert(i, mh)
+        signatures[i] = mh
+        kept.append(row)
+    
+    return kept, len(rows) - len(kept)
+
+
 # ============================================================
 # MAIN PROCESSING
 # ============================================================
 
-def main():
+def main(near_dedup=False):
     base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     
     print("=" * 60)
@@ -448,7 +531,7 @@ def main():
             sub_category = CODE_TO_SUBCATEGORY.get(code, 'General')
             # Refine sub-category based on text content
             refined_sub = determine_subcategory(clean, category)
-            if refined_sub != list(SUBCATEGORY_KEYWORDS.get(category, {'General': []}).keys())[0]:
+            if refined_sub != FIRST_SUBCATEGORY.get(category, 'General'):
                 sub_category = refined_sub
         else:
             unmapped_count += 1
@@ -484,8 +567,8 @@ def main():
     
     for row in all_rows:
         # Normalize text for comparison
-        normalized = re.sub(r'[^a-zA-Z0-9\s]', '', row['text'].lower())
-        normalized = re.sub(r'\s+', ' ', normalized).strip()
+        normalized = NON_ALNUM_RE.sub('', row['text'].lower())
+        normalized = WS_RE.sub(' ', normalized).strip()
         
         if normalized not in seen and len(normalized) > 10:
             seen.add(normalized)
@@ -494,6 +577,12 @@ def main():
             dup_count += 1
     
     print(f"  Duplicates removed: {dup_count}")
+    
+    if near_dedup:
+        unique_rows, near_dup_count = remove_near_duplicates(unique_rows)
+        dup_count += near_dup_count
+        print(f"  Near-duplicates removed: {near_dup_count}")
+    
     print(f"  Unique requirements: {len(unique_rows)}")
     
     # ----- Step 6: Clean and validate -----
@@ -553,11 +642,12 @@ def main():
     
     # Sub-category distribution
     print(f"\n  Sub-category breakdown:")
+    subs_by_cat = defaultdict(Counter)
+    for r in final_rows:
+        subs_by_cat[r['category']][r['sub_category']] += 1
     for cat in ['Functionality', 'Security', 'Efficiency', 'Usability',
                 'Reliability', 'Maintainability', 'Portability']:
-        sub_counts = Counter(
-            r['sub_category'] for r in final_rows if r['category'] == cat
-        )
+        sub_counts = subs_by_cat.get(cat)
         if sub_counts:
             subs = ', '.join(f"{s}:{c}" for s, c in sub_counts.most_common())
             print(f"    {cat}: {subs}")
@@ -572,8 +662,8 @@ def main():
     # Sort by category for consistency
     category_order = ['Functionality', 'Security', 'Efficiency', 'Usability',
                       'Reliability', 'Maintainability', 'Portability']
-    final_rows.sort(key=lambda r: (category_order.index(r['category'])
-                                    if r['category'] in category_order else 99,
+    category_rank = {cat: i for i, cat in enumerate(category_order)}
+    final_rows.sort(key=lambda r: (category_rank.get(r['category'], 99),
                                     r['sub_category']))
     
     with open(output_path, 'w', newline='', encoding='utf-8') as f:
@@ -583,8 +673,8 @@ def main():
             'Keywords', 'Confidence', 'Source'
         ])
         
-        for i, row in enumerate(final_rows, 1):
-            writer.writerow([
+        writer.writerows(
+            (
                 i,
                 row['text'],
                 row['category'],
@@ -592,7 +682,9 @@ def main():
                 row['keywords'],
                 row['confidence'],
                 row['source'],
-            ])
+            )
+            for i, row in enumerate(final_rows, 1)
+        )
     
     print(f"  Saved to: {output_path}")
     print(f"  Total rows: {len(final_rows)}")
@@ -630,4 +722,9 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    parser = argparse.ArgumentParser(description="Build the QualityMapAI training dataset.")
+    parser.add_argument(
+        '--near-dedup', action='store_true',
+        help="also drop near-duplicate requirements (MinHash-LSH, needs datasketch)",
+    )
+    main(near_dedup=parser.parse_args().near_dedup)